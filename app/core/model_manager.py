@@ -4,19 +4,72 @@ Manages embedding models, downloading, caching, and metadata.
 """
 
 import json
+import os
 import shutil
+import importlib.util
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable, List, Tuple
+import config  # before huggingface_hub: sets HF_HUB_ENABLE_HF_TRANSFER
 import torch
+import sentence_transformers
 from sentence_transformers import SentenceTransformer
-from huggingface_hub import snapshot_download, hf_hub_download
+from huggingface_hub import snapshot_download, hf_hub_download, list_repo_files
 from huggingface_hub.utils import RepositoryNotFoundError, HfHubHTTPError
+from huggingface_hub.utils import tqdm as hf_tqdm
 from app.utils.logger import get_logger
-import config
+
+try:
+    import orjson  # Optional: faster metadata (de)serialization
+except ImportError:
+    orjson = None
 
 
 logger = get_logger(__name__)
 
+# accelerate enables low_cpu_mem_usage / device_map loading in transformers
+ACCELERATE_AVAILABLE = importlib.util.find_spec("accelerate") is not None
+
+# model_kwargs (forwarded to transformers' from_pretrained) exists since sentence-transformers 3.0
+ST_SUPPORTS_MODEL_KWARGS = int(sentence_transformers.__version__.split('.')[0]) >= 3
+
+# Loaded models shared by all ModelManager instances, keyed by (model_name, device)
+_model_cache: "OrderedDict[Tuple[str, str], SentenceTransformer]" = OrderedDict()
+_model_cache_lock = threading.Lock()
+
+
+def _make_download_tqdm(
+    progress_callback: Callable[[int, str], None],
+    start: int = 5,
+    end: int = 80,
+) -> type:
+    """
+    Build a tqdm class that reports snapshot_download file progress.
+
+    snapshot_download drives one bar over the repository files; each
+    completed file is mapped into the [start, end] range of the callback.
+
+    Args:
+        progress_callback: Callback(progress_pct, status_msg)
+        start: Progress reported before the first file finishes
+        end: Progress reported once all files are downloaded
+
+    Returns:
+        tqdm subclass to pass as snapshot_download(tqdm_class=...)
+    """
+
+    class _DownloadProgress(hf_tqdm):
+        def update(self, n=1):
+            result = super().update(n)
+            if self.total:
+                pct = start + int((end - start) * self.n / self.total)
+                progress_callback(pct, f"Downloaded {self.n}/{self.total} files")
+            return result
+
+    return _DownloadProgress
+
 
 class ModelMetadata:
     """Model metadata container."""
@@ -104,6 +157,13 @@ class ModelManager:
         self.metadata: Dict[str, ModelMetadata] = {}
         self._load_metadata()
 
+        # Cached model directory existence checks (invalidated on download/delete)
+        self._exists_cache: Dict[str, bool] = {}
+
+        # Background downloads (see download_model_async)
+        self._download_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_downloads: Dict[str, Future] = {}
+
         # Device detection
         if device is None:
             self.device = config.DEFAULT_DEVICE
@@ -116,8 +176,11 @@ class ModelManager:
         """Load model metadata from file."""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                if orjson is not None:
+                    data = orjson.loads(self.metadata_file.read_bytes())
+                else:
+                    with open(self.metadata_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
 
                 self.metadata = {
                     name: ModelMetadata.from_dict(info)
@@ -138,8 +201,15 @@ class ModelManager:
                 for name, meta in self.metadata.items()
             }
 
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                content = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+            # Write to a temp file and swap it in, so a crash never leaves a truncated file
+            tmp_file = self.metadata_file.with_suffix('.tmp')
+            tmp_file.write_bytes(content)
+            os.replace(tmp_file, self.metadata_file)
 
             self.logger.info("Metadata saved successfully")
 
@@ -180,8 +250,12 @@ class ModelManager:
         if model_name not in self.metadata:
             return False
 
-        model_path = self.metadata[model_name].model_path
-        return model_path.exists()
+        exists = self._exists_cache.get(model_name)
+        if exists is None:
+            exists = self.metadata[model_name].model_path.exists()
+            self._exists_cache[model_name] = exists
+
+        return exists
 
     def get_model_path(self, model_name: str) -> Optional[Path]:
         """
@@ -240,8 +314,10 @@ class ModelManager:
                 repo_id=model_name,
                 local_dir=str(model_path),
                 local_dir_use_symlinks=False,
-                ignore_patterns=["*.h5", "*.onnx"],
-                resume_download=True
+                ignore_patterns=self._get_ignore_patterns(model_name),
+                resume_download=True,
+                max_workers=config.DOWNLOAD_MAX_WORKERS,
+                tqdm_class=_make_download_tqdm(progress_callback) if progress_callback else None,
             )
 
             if progress_callback:
@@ -250,14 +326,8 @@ class ModelManager:
             # Calculate model size
             size_mb = self._calculate_dir_size(model_path)
 
-            # Get model info (try to load to get max_seq_length)
-            max_seq_length = 512
-            try:
-                temp_model = SentenceTransformer(str(model_path))
-                max_seq_length = temp_model.max_seq_length
-                del temp_model
-            except Exception as e:
-                self.logger.warning(f"Could not load model for info: {e}")
+            # Get model info from config files (no need to load the weights)
+            max_seq_length = self._read_max_seq_length(model_path)
 
             # Create metadata
             from datetime import datetime
@@ -271,6 +341,7 @@ class ModelManager:
 
             # Save metadata
             self.metadata[model_name] = metadata
+            self._exists_cache.pop(model_name, None)
             self._save_metadata()
 
             if progress_callback:
@@ -295,6 +366,78 @@ class ModelManager:
             self.logger.error(error_msg)
             raise
 
+    def download_model_async(
+        self,
+        model_name: str,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+        force: bool = False,
+    ) -> Future:
+        """
+        Start downloading a model in a background thread.
+
+        Lets callers overlap the network-bound download with other setup work
+        (e.g. building a TextProcessor). load_model() waits for a pending
+        download of the same model instead of starting another one.
+
+        Args:
+            model_name: HuggingFace model identifier
+            progress_callback: Callback(progress_pct, status_msg), called from the download thread
+            force: Force re-download even if cached
+
+        Returns:
+            Future resolving to the model path
+        """
+        pending = self._pending_downloads.get(model_name)
+        if pending is not None and not pending.done():
+            return pending
+
+        if self._download_executor is None:
+            self._download_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="model-download"
+            )
+
+        future = self._download_executor.submit(
+            self.download_model, model_name, progress_callback, force
+        )
+        self._pending_downloads[model_name] = future
+        future.add_done_callback(lambda _: self._pending_downloads.pop(model_name, None))
+
+        self.logger.info(f"Started background download: {model_name}")
+
+        return future
+
+    def _get_ignore_patterns(self, model_name: str) -> List[str]:
+        """
+        Get file patterns to skip when downloading a model.
+
+        Framework exports are always skipped. PyTorch .bin weights are
+        skipped when a safetensors file sits in the same directory, since
+        both hold the same weights.
+
+        Args:
+            model_name: HuggingFace model identifier
+
+        Returns:
+            List of ignore patterns for snapshot_download
+        """
+        patterns = ["*.h5", "*.onnx", "*.msgpack", "*.ot", "openvino/*"]
+
+        try:
+            repo_files = list_repo_files(model_name)
+        except Exception as e:
+            self.logger.warning(f"Could not list repository files: {e}")
+            return patterns
+
+        safetensors_dirs = {
+            os.path.dirname(f) for f in repo_files if f.endswith('.safetensors')
+        }
+        patterns.extend(
+            f for f in repo_files
+            if f.endswith('.bin') and os.path.dirname(f) in safetensors_dirs
+        )
+
+        return patterns
+
     def load_model(
         self,
         model_name: str,
@@ -315,6 +458,19 @@ class ModelManager:
         Raises:
             Exception if model cannot be loaded
         """
+        cache_key = (model_name, self.device)
+
+        with _model_cache_lock:
+            model = _model_cache.get(cache_key)
+            if model is not None:
+                _model_cache.move_to_end(cache_key)
+
+        if model is not None:
+            self.logger.info(f"Using already loaded model: {model_name}")
+            if progress_callback:
+                progress_callback(100, "Model loaded")
+            return model
+
         try:
             # Check if it's a local path
             if Path("models/embeddings/"+model_name).exists():
@@ -322,13 +478,22 @@ class ModelManager:
                 if progress_callback:
                     progress_callback(50, "Loading model...")
 
-                model = SentenceTransformer("models/embeddings/"+model_name, device=self.device, local_files_only=True)
+                model = self._create_sentence_transformer(
+                    Path("models/embeddings/"+model_name), local_files_only=True
+                )
+                self._cache_loaded_model(cache_key, model)
 
                 if progress_callback:
                     progress_callback(100, "Model loaded")
 
                 return model
 
+            # Wait for a background download of this model, if any
+            pending = self._pending_downloads.get(model_name)
+            if pending is not None:
+                self.logger.info(f"Waiting for background download: {model_name}")
+                pending.result()
+
             # Check if cached
             if not self.is_model_cached(model_name):
                 if download_if_missing:
@@ -344,7 +509,8 @@ class ModelManager:
                 progress_callback(50, "Loading model from cache...")
 
             self.logger.info(f"Loading model from cache: {model_path}")
-            model = SentenceTransformer(str(model_path), device=self.device)
+            model = self._create_sentence_transformer(model_path)
+            self._cache_loaded_model(cache_key, model)
 
             if progress_callback:
                 progress_callback(100, "Model loaded")
@@ -358,6 +524,70 @@ class ModelManager:
             self.logger.error(error_msg)
             raise
 
+    def _create_sentence_transformer(self, model_path: Path, **kwargs) -> SentenceTransformer:
+        """
+        Instantiate a SentenceTransformer from a local directory.
+
+        transformers already prefers (and memory-maps) safetensors weights.
+        With accelerate installed, weights are materialized directly on the
+        target device, skipping the intermediate CPU copy.
+
+        Args:
+            model_path: Model directory
+            **kwargs: Extra SentenceTransformer arguments
+
+        Returns:
+            Loaded SentenceTransformer model
+        """
+        model_kwargs = {}
+
+        if ST_SUPPORTS_MODEL_KWARGS and ACCELERATE_AVAILABLE:
+            model_kwargs['low_cpu_mem_usage'] = True
+            if self.device.startswith('cuda'):
+                model_kwargs['device_map'] = self.device
+
+        if model_kwargs:
+            kwargs['model_kwargs'] = model_kwargs
+
+        return SentenceTransformer(str(model_path), device=self.device, **kwargs)
+
+    def _cache_loaded_model(self, cache_key: Tuple[str, str], model: SentenceTransformer) -> None:
+        """
+        Keep a loaded model in memory, evicting the least recently used one.
+
+        Evicted models are only dropped from the cache, never moved: another
+        analyzer may still be encoding with them. Their memory is freed once
+        the last holder releases them.
+
+        Args:
+            cache_key: (model_name, device)
+            model: Loaded model
+        """
+        evicted_any = False
+        with _model_cache_lock:
+            _model_cache[cache_key] = model
+            _model_cache.move_to_end(cache_key)
+
+            while len(_model_cache) > config.MODEL_CACHE_SIZE:
+                evicted_name = _model_cache.popitem(last=False)[0][0]
+                evicted_any = True
+                self.logger.info(f"Evicted model from memory: {evicted_name}")
+
+        # Return freed blocks to the driver if the cache held the last reference
+        if evicted_any and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def _evict_loaded_model(self, model_name: str) -> None:
+        """
+        Drop a model from the in-memory cache on all devices.
+
+        Args:
+            model_name: Name of the model
+        """
+        with _model_cache_lock:
+            for key in [key for key in _model_cache if key[0] == model_name]:
+                del _model_cache[key]
+
     def delete_model(self, model_name: str) -> bool:
         """
         Delete a cached model.
@@ -374,6 +604,7 @@ class ModelManager:
 
         try:
             model_path = self.metadata[model_name].model_path
+            self._evict_loaded_model(model_name)
 
             if model_path.exists():
                 shutil.rmtree(model_path)
@@ -381,6 +612,7 @@ class ModelManager:
 
             # Remove from metadata
             del self.metadata[model_name]
+            self._exists_cache.pop(model_name, None)
             self._save_metadata()
 
             self.logger.info(f"Model '{model_name}' deleted successfully")
@@ -401,12 +633,54 @@ class ModelManager:
             Size in MB
         """
         total_size = 0
-        for file in path.rglob('*'):
-            if file.is_file():
-                total_size += file.stat().st_size
+        stack = [str(path)]
+
+        # Iterative scandir walk: DirEntry caches the file type, so no Path objects
+        # or extra is_file() syscalls per entry
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
 
         return total_size / (1024 * 1024)  # Convert to MB
 
+    def _read_max_seq_length(self, model_path: Path, default: int = 512) -> int:
+        """
+        Read max sequence length from a model's config files.
+
+        Checks sentence_bert_config.json first, then falls back to the
+        transformer's config.json (max_position_embeddings).
+
+        Args:
+            model_path: Model directory
+            default: Value used if neither file provides a length
+
+        Returns:
+            Maximum sequence length
+        """
+        candidates = [
+            ('sentence_bert_config.json', 'max_seq_length'),
+            ('config.json', 'max_position_embeddings'),
+        ]
+
+        for filename, key in candidates:
+            config_file = model_path / filename
+            if not config_file.exists():
+                continue
+
+            try:
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    value = json.load(f).get(key)
+                if value:
+                    return int(value)
+            except Exception as e:
+                self.logger.warning(f"Could not read {filename}: {e}")
+
+        return default
+
     def get_device_info(self) -> Dict[str, Any]:
         """
         Get device information.
@@ -434,8 +708,15 @@ class ModelManager:
             True if successful
         """
         try:
-            for model_name in list(self.metadata.keys()):
-                self.delete_model(model_name)
+            # Remove all model directories, then write metadata once
+            for model_name, meta in list(self.metadata.items()):
+                self._evict_loaded_model(model_name)
+                if meta.model_path.exists():
+                    shutil.rmtree(meta.model_path, ignore_errors=True)
+
+            self.metadata.clear()
+            self._exists_cache.clear()
+            self._save_metadata()
 
             self.logger.info("Cache cleared successfully")
             return True
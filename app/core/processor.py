@@ -3,12 +3,12 @@ BERTopic Pro - Text Processor
 Core text processing module with Jieba integration and cleaning pipeline.
 """
 
-import re
-from typing import List, Set, Optional, Callable
+from typing import List, Set, FrozenSet, Optional, Callable
 from pathlib import Path
 import pandas as pd
-import jieba
-import jieba.posseg as pseg
+from joblib import Parallel, delayed
+from app.core import text_pipeline
+from app.core.text_pipeline import jieba, cut_precise, cut_full, cut_pos
 from app.utils.logger import get_logger
 import config
 
@@ -40,37 +40,31 @@ class TextProcessor:
         Args:
             stopwords_path: Path to stopwords file
             custom_dict_path: Path to custom Jieba dictionary
-            enable_parallel: Whether to enable Jieba parallel mode
+            enable_parallel: Whether to process DataFrames in worker processes
         """
         self.logger = get_logger(self.__class__.__name__)
 
         # Load stopwords
-        self.stopwords: Set[str] = set()
+        self.stopwords: FrozenSet[str] = frozenset()
         if stopwords_path and stopwords_path.exists():
             self.load_stopwords(stopwords_path)
         elif config.DEFAULT_STOPWORDS_PATH.exists():
             self.load_stopwords(config.DEFAULT_STOPWORDS_PATH)
 
         # Load custom dictionary
+        self.custom_dict_path: Optional[Path] = None
         if custom_dict_path and custom_dict_path.exists():
-            jieba.load_userdict(str(custom_dict_path))
+            text_pipeline.load_userdict(str(custom_dict_path))
+            self.custom_dict_path = custom_dict_path
             self.logger.info(f"Loaded custom dictionary: {custom_dict_path}")
 
-        # Enable parallel mode
+        # Parallel mode: process_dataframe runs the pipeline in worker processes
+        self.n_jobs = 1
         if enable_parallel and config.JIEBA_PARALLEL_MODE:
-            jieba.enable_parallel(config.JIEBA_PARALLEL_PROCESSES)
-            self.logger.info(f"Jieba parallel mode enabled ({config.JIEBA_PARALLEL_PROCESSES} processes)")
+            self.n_jobs = config.JIEBA_PARALLEL_PROCESSES
+            self.logger.info(f"Parallel processing enabled ({self.n_jobs} processes)")
 
-        # Regex patterns
-        self.url_pattern = re.compile(
-            r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        )
-        self.email_pattern = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
-        self.punctuation_pattern = re.compile(r'[^\w\s]')
-        self.whitespace_pattern = re.compile(r'\s+')
-        self.number_pattern = re.compile(r'\d+')
-
-        self.logger.info("TextProcessor initialized")
+        self.logger.info(f"TextProcessor initialized (segmenter: {jieba.__name__})")
 
     def load_stopwords(self, stopwords_path: Path) -> None:
         """
@@ -81,7 +75,7 @@ class TextProcessor:
         """
         try:
             with open(stopwords_path, 'r', encoding='utf-8') as f:
-                self.stopwords = set(line.strip() for line in f if line.strip())
+                self.stopwords = frozenset(line.strip() for line in f if line.strip())
 
             self.logger.info(f"Loaded {len(self.stopwords)} stopwords from {stopwords_path}")
 
@@ -95,7 +89,7 @@ class TextProcessor:
         Args:
             words: List of stopwords to add
         """
-        self.stopwords.update(words)
+        self.stopwords = self.stopwords | frozenset(words)
         self.logger.info(f"Added {len(words)} stopwords, total: {len(self.stopwords)}")
 
     def segment(
@@ -122,11 +116,12 @@ class TextProcessor:
 
         if use_pos and allowed_pos:
             # POS tagging mode
-            words = pseg.cut(text)
-            return [word for word, pos in words if pos in allowed_pos]
+            return [word for word, pos in cut_pos(text) if pos in allowed_pos]
+        elif cut_all:
+            return list(cut_full(text))
         else:
             # Regular segmentation
-            return list(jieba.cut(text, cut_all=cut_all))
+            return list(cut_precise(text))
 
     def remove_stopwords(self, words: List[str]) -> List[str]:
         """
@@ -138,7 +133,21 @@ class TextProcessor:
         Returns:
             List of words without stopwords
         """
-        return [word for word in words if word not in self.stopwords]
+        stopwords = self.stopwords
+        return [word for word in words if word not in stopwords]
+
+    @staticmethod
+    def _resolve_clean_options(clean_options: Optional[dict]) -> dict:
+        """Return clean_options, or the configured defaults if None."""
+        if clean_options is not None:
+            return clean_options
+
+        return {
+            'remove_urls': config.DEFAULT_REMOVE_URLS,
+            'remove_emails': config.DEFAULT_REMOVE_EMAILS,
+            'remove_punctuation': config.DEFAULT_REMOVE_PUNCTUATION,
+            'lowercase': config.DEFAULT_LOWERCASE,
+        }
 
     def clean_text(
         self,
@@ -168,31 +177,15 @@ class TextProcessor:
         if not text or not isinstance(text, str):
             return ""
 
-        # Remove URLs
-        if remove_urls:
-            text = self.url_pattern.sub(' ', text)
-
-        # Remove emails
-        if remove_emails:
-            text = self.email_pattern.sub(' ', text)
-
-        # Remove numbers
-        if remove_numbers:
-            text = self.number_pattern.sub(' ', text)
-
-        # Remove punctuation
-        if remove_punctuation:
-            text = self.punctuation_pattern.sub(' ', text)
-
-        # Lowercase
-        if lowercase:
-            text = text.lower()
-
-        # Normalize whitespace
-        if strip_whitespace:
-            text = self.whitespace_pattern.sub(' ', text).strip()
-
-        return text
+        return text_pipeline.clean_text(
+            text,
+            remove_urls=remove_urls,
+            remove_emails=remove_emails,
+            remove_punctuation=remove_punctuation,
+            remove_numbers=remove_numbers,
+            lowercase=lowercase,
+            strip_whitespace=strip_whitespace,
+        )
 
     def process_text(
         self,
@@ -218,32 +211,28 @@ class TextProcessor:
         if not text or not isinstance(text, str):
             return ""
 
-        # Default cleaning options
-        if clean_options is None:
-            clean_options = {
-                'remove_urls': config.DEFAULT_REMOVE_URLS,
-                'remove_emails': config.DEFAULT_REMOVE_EMAILS,
-                'remove_punctuation': config.DEFAULT_REMOVE_PUNCTUATION,
-                'lowercase': config.DEFAULT_LOWERCASE,
-            }
+        clean_options = self._resolve_clean_options(clean_options)
 
+        return self._process_text_fast(
+            text, segment, remove_stopwords, clean_options, min_word_length
+        )
+
+    def _process_text_fast(
+        self,
+        text: str,
+        segment: bool,
+        remove_stopwords: bool,
+        clean_options: dict,
+        min_word_length: int,
+    ) -> str:
+        """process_text() without input validation; text must be a str."""
         # Clean text first
-        cleaned = self.clean_text(text, **clean_options)
+        cleaned = text_pipeline.clean_text(text, **clean_options)
 
         # Segment if requested
         if segment:
-            words = self.segment(cleaned)
-
-            # Remove stopwords
-            if remove_stopwords:
-                words = self.remove_stopwords(words)
-
-            # Filter by word length
-            if min_word_length > 1:
-                words = [w for w in words if len(w) >= min_word_length]
-
-            # Join back to string
-            return ' '.join(words)
+            stopwords = self.stopwords if remove_stopwords else frozenset()
+            return text_pipeline.join_words(cleaned, stopwords, min_word_length)
 
         return cleaned
 
@@ -274,23 +263,54 @@ class TextProcessor:
         output_column = output_column or f"{text_column}_processed"
 
         total_rows = len(df)
-        processed_texts = []
 
         self.logger.info(f"Processing {total_rows} texts...")
 
-        for idx, text in enumerate(df[text_column]):
-            # Process text
-            processed = self.process_text(text, **processing_options)
-            processed_texts.append(processed)
-
-            # Progress callback
-            if progress_callback and (idx + 1) % 100 == 0:
-                progress = int((idx + 1) / total_rows * 100)
-                progress_callback(progress, f"Processing: {idx + 1}/{total_rows}")
+        texts = df[text_column]
+        # Worker processes pay imports and a Jieba dictionary load up front
+        parallel = self.n_jobs > 1 and total_rows >= config.PARALLEL_MIN_ROWS
+        chunk_size = config.PARALLEL_CHUNK_SIZE if parallel else config.PROCESSING_CHUNK_SIZE
+        chunks = [
+            texts.iloc[start:start + chunk_size] for start in range(0, total_rows, chunk_size)
+        ]
+
+        if parallel:
+            # Each worker runs the whole pipeline on its chunk; results stay ordered
+            custom_dict = str(self.custom_dict_path) if self.custom_dict_path else None
+            stopwords = self.stopwords
+            clean_options = self._resolve_clean_options(processing_options.get('clean_options'))
+            worker_options = {**processing_options, 'clean_options': clean_options}
+            results = Parallel(n_jobs=self.n_jobs, backend='loky', return_as='generator')(
+                delayed(text_pipeline.process_chunk)(chunk, stopwords, custom_dict, worker_options)
+                for chunk in chunks
+            )
+        else:
+            results = (self._process_series(chunk, **processing_options) for chunk in chunks)
+
+        # Collect chunks, reporting progress per block
+        processed_chunks = []
+        done = 0
+        for result in results:
+            processed_chunks.append(result)
+            done += len(result)
+            if progress_callback and done < total_rows:
+                progress = int(done / total_rows * 100)
+                progress_callback(progress, f"Processing: {done}/{total_rows}")
+
+        processed = pd.concat(processed_chunks) if processed_chunks else texts.iloc[:0]
+
+        if not parallel and processing_options.get('segment', True):
+            cache_info = cut_precise.cache_info()
+            lookups = cache_info.hits + cache_info.misses
+            if lookups:
+                self.logger.info(
+                    f"Segmentation cache hit ratio: {cache_info.hits / lookups:.1%} "
+                    f"({cache_info.currsize} cached texts)"
+                )
 
         # Create output column
         df = df.copy()
-        df[output_column] = processed_texts
+        df[output_column] = processed.tolist()
 
         if progress_callback:
             progress_callback(100, f"Completed: {total_rows} texts processed")
@@ -299,6 +319,36 @@ class TextProcessor:
 
         return df
 
+    def _process_series(
+        self,
+        texts: pd.Series,
+        segment: bool = True,
+        remove_stopwords: bool = True,
+        clean_options: Optional[dict] = None,
+        min_word_length: int = 1,
+    ) -> pd.Series:
+        """
+        Vectorized counterpart of process_text() for a block of texts.
+
+        Args:
+            texts: Series of raw texts
+            segment: Whether to segment text
+            remove_stopwords: Whether to remove stopwords
+            clean_options: Cleaning options dict (if None, uses defaults)
+            min_word_length: Minimum word length to keep
+
+        Returns:
+            Series of processed texts
+        """
+        return text_pipeline.process_series(
+            texts,
+            self.stopwords,
+            self._resolve_clean_options(clean_options),
+            segment=segment,
+            remove_stopwords=remove_stopwords,
+            min_word_length=min_word_length,
+        )
+
     def get_word_frequencies(
         self,
         texts: List[str],
@@ -315,13 +365,16 @@ class TextProcessor:
             List of (word, frequency) tuples
         """
         from collections import Counter
+        from itertools import chain
 
-        word_counter = Counter()
+        # Count all segmented words in a single Counter pass
+        word_counter = Counter(chain.from_iterable(
+            cut_precise(text) for text in texts if text and isinstance(text, str)
+        ))
 
-        for text in texts:
-            words = self.segment(text)
-            words = self.remove_stopwords(words)
-            word_counter.update(words)
+        # Drop stopwords once over the vocabulary instead of per occurrence
+        for word in word_counter.keys() & self.stopwords:
+            del word_counter[word]
 
         return word_counter.most_common(top_n)
 
@@ -0,0 +1,286 @@
+"""
+BERTopic Pro - Text Pipeline
+Jieba segmentation and regex cleaning behind TextProcessor.
+
+Kept free of heavy imports (torch, config, Qt) so the worker processes
+that run process_chunk() start quickly.
+"""
+
+import re
+import importlib.util
+from functools import lru_cache
+from typing import Any, FrozenSet, Optional, Set, Tuple
+import pandas as pd
+try:
+    # Optional: Cython implementation of Jieba with the same API
+    import jieba_fast as jieba
+    import jieba_fast.posseg as pseg
+except ImportError:
+    import jieba
+    import jieba.posseg as pseg
+
+try:
+    import re2  # Optional: google-re2, linear-time matching for clean_text
+except ImportError:
+    re2 = None
+
+# Optional: Arrow-backed string columns, cleaned with Arrow's RE2 kernels
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+# Removal patterns, written once and spelled per regex engine (stdlib re,
+# RE2 via google-re2 or Arrow) so every cleaning path treats text alike.
+# Python's Unicode \w and \d are exactly [\p{L}\p{N}_] and \p{Nd}; RE2's
+# \w, \d and \s are ASCII-only, so RE2 gets the Unicode classes spelled out.
+_PATTERN_TEMPLATES = {
+    'url': r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+',
+    'email': r'[{word}\.-]+@[{word}\.-]+\.[{word}]+',
+    'number': r'[{digit}]+',
+    'punctuation': r'[^{word}{space}]',
+    'whitespace': r'[{space}]+',
+}
+
+# Python's str whitespace (\s in re), as literal characters both engines accept
+_SPACE = '\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+
+_CLASS_SPELLINGS = {
+    're': {'word': r'\w', 'digit': r'\d', 'space': _SPACE},
+    're2': {'word': r'\p{L}\p{N}_', 'digit': r'\p{Nd}', 'space': _SPACE},
+}
+
+_PATTERNS = {
+    engine: {name: template.format(**classes) for name, template in _PATTERN_TEMPLATES.items()}
+    for engine, classes in _CLASS_SPELLINGS.items()
+}
+
+_whitespace_pattern = re.compile(_PATTERNS['re']['whitespace'])
+
+# Segmentation caches: corpora often repeat headlines, footers and reposts
+_CUT_CACHE_SIZE = 131072
+
+
+@lru_cache(maxsize=_CUT_CACHE_SIZE)
+def cut_precise(text: str) -> Tuple[str, ...]:
+    """Cached Jieba precise-mode segmentation."""
+    return tuple(jieba.cut(text, cut_all=False))
+
+
+@lru_cache(maxsize=_CUT_CACHE_SIZE)
+def cut_full(text: str) -> Tuple[str, ...]:
+    """Cached Jieba full-mode segmentation."""
+    return tuple(jieba.cut(text, cut_all=True))
+
+
+@lru_cache(maxsize=_CUT_CACHE_SIZE)
+def cut_pos(text: str) -> Tuple[Tuple[str, str], ...]:
+    """Cached Jieba POS-tagged segmentation as (word, pos) pairs."""
+    return tuple((pair.word, pair.flag) for pair in pseg.cut(text))
+
+
+def clear_cut_caches() -> None:
+    """Drop cached segmentations (needed after the Jieba dictionary changes)."""
+    cut_precise.cache_clear()
+    cut_full.cache_clear()
+    cut_pos.cache_clear()
+
+
+def load_userdict(path: str) -> None:
+    """Load a custom Jieba dictionary and drop segmentations made without it."""
+    jieba.load_userdict(path)
+    clear_cut_caches()
+
+
+def combined_source(
+    remove_urls: bool,
+    remove_emails: bool,
+    remove_numbers: bool,
+    remove_punctuation: bool,
+    re2_syntax: bool = False,
+) -> Optional[str]:
+    """
+    Build the alternation source for the enabled removal steps.
+
+    Alternatives are ordered URL, email, number, punctuation so that the
+    longer structured matches win over single punctuation characters.
+
+    Args:
+        re2_syntax: Use the RE2 spellings of the patterns
+
+    Returns:
+        Regex source, or None if no removal step is enabled
+    """
+    patterns = _PATTERNS['re2' if re2_syntax else 're']
+    candidates = (patterns['url'], patterns['email'], patterns['number'], patterns['punctuation'])
+
+    flags = (remove_urls, remove_emails, remove_numbers, remove_punctuation)
+    sources = [source for enabled, source in zip(flags, candidates) if enabled]
+
+    return '|'.join(sources) if sources else None
+
+
+@lru_cache(maxsize=None)
+def combined_pattern(
+    remove_urls: bool,
+    remove_emails: bool,
+    remove_numbers: bool,
+    remove_punctuation: bool,
+) -> Optional[Any]:
+    """
+    Get a single compiled regex covering all enabled removal steps.
+
+    Uses RE2 when google-re2 is installed, otherwise the stdlib engine.
+
+    Returns:
+        Compiled pattern, or None if no removal step is enabled
+    """
+    source = combined_source(
+        remove_urls, remove_emails, remove_numbers, remove_punctuation, re2_syntax=re2 is not None
+    )
+
+    if source is None:
+        return None
+    if re2 is not None:
+        return re2.compile(source)
+    return re.compile(source)
+
+
+def clean_text(
+    text: str,
+    remove_urls: bool = True,
+    remove_emails: bool = True,
+    remove_punctuation: bool = True,
+    remove_numbers: bool = False,
+    lowercase: bool = False,
+    strip_whitespace: bool = True,
+) -> str:
+    """Clean one text (no input validation; text must be a str)."""
+    # Remove URLs, emails, numbers and punctuation in a single pass
+    pattern = combined_pattern(remove_urls, remove_emails, remove_numbers, remove_punctuation)
+    if pattern is not None:
+        text = pattern.sub(' ', text)
+
+    # Lowercase
+    if lowercase:
+        text = text.lower()
+
+    # Normalize whitespace
+    if strip_whitespace:
+        text = _whitespace_pattern.sub(' ', text).strip()
+
+    return text
+
+
+def clean_series(
+    texts: pd.Series,
+    remove_urls: bool = True,
+    remove_emails: bool = True,
+    remove_punctuation: bool = True,
+    remove_numbers: bool = False,
+    lowercase: bool = False,
+    strip_whitespace: bool = True,
+) -> pd.Series:
+    """Vectorized clean_text() for a whole column (non-string values become "")."""
+    is_text = texts.map(lambda t: isinstance(t, str))
+    s = texts.where(is_text, "")
+
+    if PYARROW_AVAILABLE:
+        # Contiguous Arrow buffers; string patterns run in Arrow's RE2 kernel
+        s = s.astype("string[pyarrow]")
+
+        source = combined_source(
+            remove_urls, remove_emails, remove_numbers, remove_punctuation, re2_syntax=True
+        )
+        if source is not None:
+            s = s.str.replace(source, ' ', regex=True)
+
+        if lowercase:
+            s = s.str.lower()
+
+        if strip_whitespace:
+            s = s.str.replace(_PATTERNS['re2']['whitespace'], ' ', regex=True).str.strip()
+
+        return s
+
+    s = s.astype(str)
+
+    pattern = combined_pattern(remove_urls, remove_emails, remove_numbers, remove_punctuation)
+    if pattern is not None:
+        if isinstance(pattern, re.Pattern):
+            s = s.str.replace(pattern, ' ', regex=True)
+        else:
+            s = s.map(lambda t: pattern.sub(' ', t))
+
+    if lowercase:
+        s = s.str.lower()
+
+    if strip_whitespace:
+        s = s.str.replace(_whitespace_pattern, ' ', regex=True).str.strip()
+
+    return s
+
+
+def join_words(text: str, stopwords: FrozenSet[str], min_word_length: int) -> str:
+    """Segment a cleaned text, dropping stopwords and short words while joining."""
+    if not text:
+        return ""
+    return ' '.join(
+        w for w in cut_precise(text)
+        if w not in stopwords and len(w) >= min_word_length
+    )
+
+
+def process_series(
+    texts: pd.Series,
+    stopwords: FrozenSet[str],
+    clean_options: dict,
+    segment: bool = True,
+    remove_stopwords: bool = True,
+    min_word_length: int = 1,
+) -> pd.Series:
+    """
+    Clean and segment a block of texts.
+
+    Args:
+        texts: Series of raw texts
+        stopwords: Stopwords to drop
+        clean_options: Keyword arguments for clean_series()
+        segment: Whether to segment text
+        remove_stopwords: Whether to remove stopwords
+        min_word_length: Minimum word length to keep
+
+    Returns:
+        Series of processed texts
+    """
+    # Clean the whole block at once (vectorized regex in pandas)
+    cleaned = clean_series(texts, **clean_options)
+
+    if not segment:
+        return cleaned
+
+    if not remove_stopwords:
+        stopwords = frozenset()
+
+    return cleaned.map(lambda text: join_words(text, stopwords, min_word_length))
+
+
+# Custom dictionaries already loaded into this (worker) process
+_loaded_user_dicts: Set[str] = set()
+
+
+def process_chunk(
+    texts: pd.Series,
+    stopwords: FrozenSet[str],
+    custom_dict_path: Optional[str],
+    processing_options: dict,
+) -> pd.Series:
+    """
+    Run process_series() on one chunk inside a worker process.
+
+    The custom dictionary is loaded once per worker process and reused
+    across chunks.
+    """
+    if custom_dict_path and custom_dict_path not in _loaded_user_dicts:
+        load_userdict(custom_dict_path)
+        _loaded_user_dicts.add(custom_dict_path)
+
+    return process_series(texts, stopwords, **processing_options)
@@ -3,25 +3,63 @@ BERTopic Pro - Topic Analyzer
 Wrapper for BERTopic with parameter management and persistence.
 """
 
+import json
+import os
+import time
+import pickle
+import shutil
 import joblib
 import hashlib
+import importlib.util
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Callable, Tuple
 import pandas as pd
 import numpy as np
+import torch
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
 from bertopic import BERTopic
 from sentence_transformers import SentenceTransformer
+from joblib import Parallel, delayed
 from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.metrics import pairwise_distances
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import IncrementalPCA
 from umap import UMAP
+from pynndescent import NNDescent
 from hdbscan import HDBSCAN
 from app.utils.logger import get_logger
 from app.core.model_manager import ModelManager
 import config
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# joblib's lz4 codec needs the lz4 package; zlib level 1 is the stdlib fallback
+JOBLIB_COMPRESS = ('lz4', 1) if importlib.util.find_spec("lz4") is not None else ('zlib', 1)
+
+# RAPIDS cuML provides GPU UMAP/HDBSCAN; imported lazily since it initializes CUDA
+CUML_AVAILABLE = importlib.util.find_spec("cuml") is not None
+
 
 logger = get_logger(__name__)
 
 
+def _new_cache_hasher():
+    """
+    Return a fast hasher for cache keys.
+
+    xxh3_128 when xxhash is installed; otherwise SHA-256, which OpenSSL
+    runs on the CPU's SHA extensions and outpaces blake2b on modern x86/ARM.
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    return hashlib.sha256()
+
+
 class TopicModelParams:
     """Container for BERTopic parameters."""
 
@@ -29,6 +67,8 @@ class TopicModelParams:
         self,
         # Embedding params
         embedding_model: str = config.DEFAULT_EMBEDDING_MODEL,
+        embedding_dtype: str = config.DEFAULT_EMBEDDING_CACHE_DTYPE,
+        embedding_batch_size: Optional[int] = None,
 
         # UMAP params
         umap_n_neighbors: int = config.DEFAULT_UMAP_N_NEIGHBORS,
@@ -40,6 +80,12 @@ class TopicModelParams:
         hdbscan_min_cluster_size: int = config.DEFAULT_HDBSCAN_MIN_CLUSTER_SIZE,
         hdbscan_min_samples: int = config.DEFAULT_HDBSCAN_MIN_SAMPLES,
         hdbscan_metric: str = 'euclidean',
+        hdbscan_use_approx_knn: bool = True,
+        hdbscan_knn: int = config.DEFAULT_HDBSCAN_KNN,
+
+        # Clustering backend ('hdbscan' or 'kmeans' for very large corpora)
+        cluster_backend: str = 'hdbscan',
+        n_clusters: int = config.DEFAULT_KMEANS_N_CLUSTERS,
 
         # c-TF-IDF params
         top_n_words: int = config.DEFAULT_TOP_N_WORDS,
@@ -50,9 +96,14 @@ class TopicModelParams:
         nr_topics: Optional[int] = None,
         calculate_probabilities: bool = False,
         verbose: bool = True,
+        reproducible: bool = False,
+        backend: str = 'auto',
     ):
         # Embedding
         self.embedding_model = embedding_model
+        self.embedding_dtype = embedding_dtype
+        # Sentences per forward pass; None sizes batches from free GPU memory
+        self.embedding_batch_size = embedding_batch_size
 
         # UMAP
         self.umap_n_neighbors = umap_n_neighbors
@@ -64,6 +115,13 @@ class TopicModelParams:
         self.hdbscan_min_cluster_size = hdbscan_min_cluster_size
         self.hdbscan_min_samples = hdbscan_min_samples
         self.hdbscan_metric = hdbscan_metric
+        self.hdbscan_use_approx_knn = hdbscan_use_approx_knn
+        self.hdbscan_knn = hdbscan_knn
+
+        # Clustering backend; 'kmeans' replaces UMAP+HDBSCAN with
+        # IncrementalPCA+MiniBatchKMeans (no outlier topic)
+        self.cluster_backend = cluster_backend
+        self.n_clusters = n_clusters
 
         # c-TF-IDF
         self.top_n_words = top_n_words
@@ -74,11 +132,17 @@ class TopicModelParams:
         self.nr_topics = nr_topics
         self.calculate_probabilities = calculate_probabilities
         self.verbose = verbose
+        # Fixed UMAP seed; forces single-threaded layout optimization
+        self.reproducible = reproducible
+        # 'cpu', 'gpu' (cuML) or 'auto' (gpu when cuML and CUDA are available)
+        self.backend = backend
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             'embedding_model': self.embedding_model,
+            'embedding_dtype': self.embedding_dtype,
+            'embedding_batch_size': self.embedding_batch_size,
             'umap_n_neighbors': self.umap_n_neighbors,
             'umap_n_components': self.umap_n_components,
             'umap_min_dist': self.umap_min_dist,
@@ -86,12 +150,18 @@ class TopicModelParams:
             'hdbscan_min_cluster_size': self.hdbscan_min_cluster_size,
             'hdbscan_min_samples': self.hdbscan_min_samples,
             'hdbscan_metric': self.hdbscan_metric,
+            'hdbscan_use_approx_knn': self.hdbscan_use_approx_knn,
+            'hdbscan_knn': self.hdbscan_knn,
+            'cluster_backend': self.cluster_backend,
+            'n_clusters': self.n_clusters,
             'top_n_words': self.top_n_words,
             'ngram_range': self.ngram_range,
             'min_topic_size': self.min_topic_size,
             'nr_topics': self.nr_topics,
             'calculate_probabilities': self.calculate_probabilities,
             'verbose': self.verbose,
+            'reproducible': self.reproducible,
+            'backend': self.backend,
         }
 
     @classmethod
@@ -100,6 +170,191 @@ class TopicModelParams:
         return cls(**data)
 
 
+def _identity(tokens: List[str]) -> List[str]:
+    """Analyzer for already tokenized documents."""
+    return tokens
+
+
+def _analyze_documents(vectorizer_params: Dict[str, Any], documents: List[str]) -> List[List[str]]:
+    """Tokenize documents (with n-grams) in a worker process."""
+    analyze = CountVectorizer(**vectorizer_params).build_analyzer()
+    return [analyze(doc) for doc in documents]
+
+
+class ParallelCountVectorizer(CountVectorizer):
+    """
+    CountVectorizer that runs tokenization and n-gram generation in parallel.
+
+    Analysis is the single-threaded part of CountVectorizer; large inputs are
+    split into chunks analyzed in worker processes, and the resulting token
+    lists are counted with an identity analyzer. Vocabulary, feature names and
+    output matrices are identical to CountVectorizer's.
+    """
+
+    def _analyze_parallel(self, raw_documents) -> Optional[List[List[str]]]:
+        """Tokenize documents in parallel, or return None for small inputs."""
+        documents = list(raw_documents)
+        n_chars = sum(len(d) for d in documents)
+        if callable(self.analyzer) or n_chars < config.VECTORIZER_PARALLEL_MIN_CHARS:
+            return None
+
+        # Strided chunks spread c-TF-IDF's large per-topic documents across workers
+        n_chunks = max(1, min(len(documents), config.VECTORIZER_N_JOBS * 4))
+        chunks = [documents[i::n_chunks] for i in range(n_chunks)]
+        params = self.get_params()
+        results = Parallel(n_jobs=config.VECTORIZER_N_JOBS, backend='loky')(
+            delayed(_analyze_documents)(params, chunk) for chunk in chunks
+        )
+
+        # Restore the original document order from the strided chunks
+        tokens: List[Optional[List[str]]] = [None] * len(documents)
+        for i, chunk_tokens in enumerate(results):
+            tokens[i::n_chunks] = chunk_tokens
+        return tokens
+
+    def _token_counter(self, vocabulary=None) -> CountVectorizer:
+        """CountVectorizer over token lists sharing this vectorizer's counting options."""
+        return CountVectorizer(
+            analyzer=_identity,
+            lowercase=False,
+            min_df=self.min_df,
+            max_df=self.max_df,
+            max_features=self.max_features,
+            vocabulary=vocabulary,
+            binary=self.binary,
+            dtype=self.dtype,
+        )
+
+    def fit(self, raw_documents, y=None):
+        self.fit_transform(raw_documents)
+        return self
+
+    def fit_transform(self, raw_documents, y=None):
+        raw_documents = list(raw_documents)
+        tokens = self._analyze_parallel(raw_documents)
+        if tokens is None:
+            return super().fit_transform(raw_documents, y)
+
+        counter = self._token_counter(self.vocabulary)
+        X = counter.fit_transform(tokens)
+        self.vocabulary_ = counter.vocabulary_
+        self.fixed_vocabulary_ = counter.fixed_vocabulary_
+        return X
+
+    def transform(self, raw_documents):
+        raw_documents = list(raw_documents)
+        tokens = self._analyze_parallel(raw_documents)
+        if tokens is None:
+            return super().transform(raw_documents)
+
+        self._check_vocabulary()
+        return self._token_counter(self.vocabulary_).transform(tokens)
+
+
+class ApproxKNNHDBSCAN:
+    """
+    HDBSCAN over a sparse approximate k-NN distance graph.
+
+    Plain HDBSCAN computes core distances from dense neighbor queries, which
+    dominates clustering time for large corpora. Here pynndescent builds the
+    k-NN graph once and HDBSCAN runs with metric='precomputed' on the sparse
+    matrix. Exposes the labels_/probabilities_ interface BERTopic expects.
+    New documents (BERTopic.transform) take the topic of their nearest
+    clustered neighbor in the fitted k-NN index, without probabilities.
+    """
+
+    def __init__(
+        self,
+        min_cluster_size: int,
+        min_samples: Optional[int],
+        metric: str = 'euclidean',
+        n_neighbors: int = config.DEFAULT_HDBSCAN_KNN,
+    ):
+        self.min_cluster_size = min_cluster_size
+        self.min_samples = min_samples
+        self.metric = metric
+        # HDBSCAN needs at least min_samples neighbors per point
+        self.n_neighbors = max(n_neighbors, (min_samples or min_cluster_size) + 1)
+
+        self.labels_: Optional[np.ndarray] = None
+        self.probabilities_: Optional[np.ndarray] = None
+        self.index_: Optional[NNDescent] = None
+
+    def _build_graph(self, X: np.ndarray) -> sparse.csr_matrix:
+        """Build a symmetric, connected sparse k-NN distance matrix."""
+        n = X.shape[0]
+        index = NNDescent(X, n_neighbors=self.n_neighbors + 1, metric=self.metric, n_jobs=-1)
+        knn_indices, knn_dists = index.neighbor_graph
+        self.index_ = index  # kept for predict()
+
+        # Drop the self-neighbor column; explicit zeros would read as missing edges
+        rows = np.repeat(np.arange(n), self.n_neighbors)
+        cols = knn_indices[:, 1:].ravel()
+        vals = np.maximum(knn_dists[:, 1:].ravel(), 1e-8)
+        graph = sparse.csr_matrix((vals, (rows, cols)), shape=(n, n))
+        graph = graph.maximum(graph.T).tocsr()
+
+        # Chain disconnected components together through their first points
+        n_components, component_labels = connected_components(graph, directed=False)
+        if n_components > 1:
+            anchors = np.array(
+                [np.flatnonzero(component_labels == c)[0] for c in range(n_components)]
+            )
+            src, dst = anchors[:-1], anchors[1:]
+            bridge = np.linalg.norm(X[src] - X[dst], axis=1) + graph.data.max()
+            links = sparse.csr_matrix((bridge, (src, dst)), shape=(n, n))
+            graph = graph.maximum(links).maximum(links.T).tocsr()
+
+        return graph
+
+    def fit(self, X: np.ndarray, y: Optional[np.ndarray] = None) -> "ApproxKNNHDBSCAN":
+        """Cluster X and populate labels_ and probabilities_."""
+        X = np.asarray(X, dtype=np.float32)
+        clusterer = HDBSCAN(
+            min_cluster_size=self.min_cluster_size,
+            min_samples=self.min_samples,
+            metric='precomputed',
+        )
+        clusterer.fit(self._build_graph(X))
+
+        self.labels_ = clusterer.labels_
+        self.probabilities_ = clusterer.probabilities_
+        return self
+
+    def fit_predict(self, X: np.ndarray, y: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cluster X and return labels."""
+        return self.fit(X, y).labels_
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Assign new points the label of their nearest non-outlier neighbor.
+
+        BERTopic.transform calls this for clustering models other than
+        HDBSCAN. Points whose k nearest fitted neighbors are all outliers
+        get -1.
+
+        Args:
+            X: Points in the space the model was fitted on
+
+        Returns:
+            Labels, one per point
+
+        Raises:
+            ValueError: If the model has not been fitted
+        """
+        if self.index_ is None or self.labels_ is None:
+            raise ValueError("ApproxKNNHDBSCAN must be fitted before predict")
+
+        knn_indices, _ = self.index_.query(np.asarray(X, dtype=np.float32), k=self.n_neighbors)
+        neighbor_labels = self.labels_[knn_indices]
+
+        # Neighbors come sorted by distance, so the first clustered one is nearest
+        clustered = neighbor_labels != -1
+        nearest = clustered.argmax(axis=1)
+        labels = neighbor_labels[np.arange(len(neighbor_labels)), nearest]
+        return np.where(clustered.any(axis=1), labels, -1)
+
+
 class TopicAnalyzer:
     """
     Wrapper for BERTopic with extended functionality.
@@ -116,6 +371,7 @@ class TopicAnalyzer:
         self,
         model_manager: Optional[ModelManager] = None,
         cache_dir: Optional[Path] = None,
+        cache_tier: str = config.EMBEDDING_CACHE_TIER,
     ):
         """
         Initialize topic analyzer.
@@ -123,6 +379,8 @@ class TopicAnalyzer:
         Args:
             model_manager: ModelManager instance (creates new if None)
             cache_dir: Directory for caching (default: config.MODEL_DIR)
+            cache_tier: 'disk' or 'shm' (embedding/k-NN caches in /dev/shm,
+                shared in RAM across processes; falls back to disk)
         """
         self.logger = get_logger(self.__class__.__name__)
 
@@ -133,8 +391,15 @@ class TopicAnalyzer:
         self.cache_dir = cache_dir or config.MODEL_DIR / 'bertopic'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Embedding cache
+        # Embedding cache (saved models always stay on disk)
+        self.cache_tier = 'disk'
         self.embedding_cache_dir = config.EMBEDDINGS_CACHE_DIR
+        if cache_tier == 'shm':
+            if config.SHM_CACHE_DIR.parent.is_dir():
+                self.cache_tier = 'shm'
+                self.embedding_cache_dir = config.SHM_CACHE_DIR
+            else:
+                self.logger.warning("Shared memory cache unavailable, using disk cache")
         self.embedding_cache_dir.mkdir(parents=True, exist_ok=True)
 
         # BERTopic model
@@ -144,24 +409,201 @@ class TopicAnalyzer:
         # Training data references
         self.documents: Optional[List[str]] = None
         self.embeddings: Optional[np.ndarray] = None
-        self.topics: Optional[List[int]] = None
+        self.topics: Optional[np.ndarray] = None  # int32, one topic id per document
         self.probabilities: Optional[np.ndarray] = None
 
+        # Visualization caches, reset whenever the model changes
+        self._vis_reduced_embeddings: Optional[np.ndarray] = None
+        self._topic_distance_matrix: Optional[np.ndarray] = None
+        self._topic_similarity_matrix: Optional[np.ndarray] = None
+
         self.logger.info("TopicAnalyzer initialized")
 
-    def _create_umap_model(self, params: TopicModelParams) -> UMAP:
-        """Create UMAP model from parameters."""
+    def _enforce_shm_budget(self) -> None:
+        """
+        Evict expired and least recently written files from the shm cache.
+
+        /dev/shm is backed by RAM, so the cache is bounded by both age
+        (SHM_CACHE_TTL_SECONDS) and total size (SHM_CACHE_MAX_BYTES).
+        """
+        if self.cache_tier != 'shm':
+            return
+
+        try:
+            entries = []
+            with os.scandir(self.embedding_cache_dir) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            cutoff = time.time() - config.SHM_CACHE_TTL_SECONDS
+
+            for mtime, size, path in entries:
+                if mtime >= cutoff and total <= config.SHM_CACHE_MAX_BYTES:
+                    break
+                os.remove(path)
+                total -= size
+                self.logger.debug(f"Evicted shm cache file: {os.path.basename(path)}")
+        except OSError as e:
+            self.logger.warning(f"Failed to enforce shm cache budget: {e}")
+
+    def _use_gpu(self, params: TopicModelParams) -> bool:
+        """Resolve params.backend to whether cuML should be used."""
+        if params.backend == 'cpu':
+            return False
+        available = CUML_AVAILABLE and torch.cuda.is_available()
+        if params.backend == 'gpu' and not available:
+            self.logger.warning("GPU backend requested but cuML/CUDA is unavailable, using CPU")
+        return available
+
+    @staticmethod
+    def _umap_metric(params: TopicModelParams) -> str:
+        """
+        Metric actually passed to UMAP/pynndescent.
+
+        Cosine inputs are L2-normalized in train(), and on unit vectors
+        euclidean gives the same neighbor ordering while using the faster
+        euclidean kernels (and the one cuML supports everywhere).
+        """
+        return 'euclidean' if params.umap_metric == 'cosine' else params.umap_metric
+
+    @staticmethod
+    def _l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+        """Return L2-normalized embeddings, reusing the input if already unit length."""
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        if np.allclose(norms, 1.0, atol=1e-3):
+            return embeddings
+        return embeddings / np.maximum(norms, 1e-12)
+
+    def _create_umap_model(
+        self,
+        params: TopicModelParams,
+        precomputed_knn: Optional[Tuple[np.ndarray, np.ndarray, Any]] = None,
+        n_samples: int = 0,
+        use_gpu: bool = False,
+    ):
+        """Create UMAP model from parameters, optionally reusing a k-NN graph."""
+        if use_gpu:
+            from cuml.manifold import UMAP as cuUMAP
+
+            return cuUMAP(
+                n_neighbors=params.umap_n_neighbors,
+                n_components=params.umap_n_components,
+                min_dist=params.umap_min_dist,
+                metric=self._umap_metric(params),
+                random_state=42 if params.reproducible else None,
+                output_type='numpy',
+                verbose=params.verbose,
+            )
+
+        if precomputed_knn is None:
+            precomputed_knn = (None, None, None)
+
+        # UMAP ignores n_jobs when random_state is set, so a seed is opt-in
         return UMAP(
             n_neighbors=params.umap_n_neighbors,
             n_components=params.umap_n_components,
             min_dist=params.umap_min_dist,
-            metric=params.umap_metric,
-            random_state=42,
+            metric=self._umap_metric(params),
+            random_state=42 if params.reproducible else None,
+            n_jobs=-1,
+            low_memory=True,
+            init='random' if n_samples > config.UMAP_SPECTRAL_INIT_MAX_DOCS else 'spectral',
+            verbose=params.verbose,
+            precomputed_knn=precomputed_knn,
+        )
+
+    def _get_precomputed_knn(
+        self,
+        embeddings: np.ndarray,
+        params: TopicModelParams,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, Any]]:
+        """
+        Build (or load from cache) the k-NN graph UMAP would compute in fit().
+
+        The graph only depends on the embeddings, n_neighbors and metric, so
+        re-training with different min_dist/n_components or HDBSCAN settings
+        skips the neighbor search entirely.
+
+        Args:
+            embeddings: Document embeddings
+            params: Model parameters
+
+        Returns:
+            (knn_indices, knn_dists, search_index) or None for small corpora,
+            where UMAP's exact neighbor search is cheap anyway. search_index
+            is None when loaded from disk.
+        """
+        if len(embeddings) < config.UMAP_PRECOMPUTED_KNN_MIN_DOCS:
+            return None
+
+        hasher = _new_cache_hasher()
+        metric = self._umap_metric(params)
+        hasher.update(f"{embeddings.shape}|{params.umap_n_neighbors}|{metric}".encode())
+        hasher.update(np.ascontiguousarray(embeddings, dtype=np.float32).data)
+        knn_path = self.embedding_cache_dir / f"knn_{hasher.hexdigest()}.npz"
+
+        if knn_path.exists():
+            try:
+                with np.load(knn_path, allow_pickle=False) as data:
+                    self.logger.info(f"Loaded k-NN graph from cache: {knn_path.name}")
+                    return data['indices'], data['dists'], None
+            except Exception as e:
+                self.logger.warning(f"Failed to load cached k-NN graph: {e}")
+
+        self.logger.info(f"Building k-NN graph (k={params.umap_n_neighbors}, metric={metric})")
+        search_index = NNDescent(
+            embeddings,
+            n_neighbors=params.umap_n_neighbors,
+            metric=metric,
+            n_jobs=-1,
             verbose=params.verbose,
         )
+        knn_indices, knn_dists = search_index.neighbor_graph
+
+        try:
+            np.savez(knn_path, indices=knn_indices, dists=knn_dists)
+            self._enforce_shm_budget()
+        except Exception as e:
+            self.logger.warning(f"Failed to save k-NN graph cache: {e}")
+
+        return knn_indices, knn_dists, search_index
+
+    def _create_hdbscan_model(
+        self, params: TopicModelParams, n_samples: int = 0, use_gpu: bool = False
+    ):
+        """
+        Create HDBSCAN model from parameters.
+
+        Large corpora use ApproxKNNHDBSCAN unless full membership
+        probabilities are requested, which need HDBSCAN's prediction data.
+        """
+        if use_gpu:
+            from cuml.cluster import HDBSCAN as cuHDBSCAN
+
+            return cuHDBSCAN(
+                min_cluster_size=params.hdbscan_min_cluster_size,
+                min_samples=params.hdbscan_min_samples,
+                metric=params.hdbscan_metric,
+                prediction_data=True,
+                output_type='numpy',
+            )
+
+        if (
+            params.hdbscan_use_approx_knn
+            and not params.calculate_probabilities
+            and n_samples > config.HDBSCAN_APPROX_KNN_MIN_DOCS
+        ):
+            return ApproxKNNHDBSCAN(
+                min_cluster_size=params.hdbscan_min_cluster_size,
+                min_samples=params.hdbscan_min_samples,
+                metric=params.hdbscan_metric,
+                n_neighbors=params.hdbscan_knn,
+            )
 
-    def _create_hdbscan_model(self, params: TopicModelParams) -> HDBSCAN:
-        """Create HDBSCAN model from parameters."""
         return HDBSCAN(
             min_cluster_size=params.hdbscan_min_cluster_size,
             min_samples=params.hdbscan_min_samples,
@@ -169,44 +611,116 @@ class TopicAnalyzer:
             prediction_data=True,
         )
 
+    def _create_kmeans_models(
+        self, params: TopicModelParams
+    ) -> Tuple[IncrementalPCA, MiniBatchKMeans]:
+        """
+        Create streaming reduction/clustering models for very large corpora.
+
+        Both fit in fixed-size mini-batches, so memory stays bounded by the
+        batch rather than growing with the corpus as HDBSCAN does.
+        """
+        reducer = IncrementalPCA(
+            n_components=params.umap_n_components,
+            batch_size=config.KMEANS_BATCH_SIZE,
+        )
+        clusterer = MiniBatchKMeans(
+            n_clusters=params.n_clusters,
+            batch_size=config.KMEANS_BATCH_SIZE,
+            n_init=3,
+            random_state=42 if params.reproducible else None,
+        )
+        return reducer, clusterer
+
     def _create_vectorizer_model(self, params: TopicModelParams) -> CountVectorizer:
         """Create CountVectorizer for c-TF-IDF."""
-        return CountVectorizer(
+        return ParallelCountVectorizer(
             ngram_range=params.ngram_range,
             stop_words=None,  # Stopwords already removed in preprocessing
         )
 
-    def _get_embedding_cache_path(self, documents: List[str]) -> Path:
+    def _get_embedding_cache_path(
+        self,
+        documents: List[str],
+        embedding_model_name: str,
+        normalize_embeddings: bool = False,
+    ) -> Path:
         """
-        Get cache path for embeddings based on document hash.
+        Get cache path for embeddings based on a hash of the full corpus.
 
         Args:
             documents: List of documents
+            embedding_model_name: Name of embedding model (part of the key)
+            normalize_embeddings: Whether the embeddings are L2-normalized (part of the key)
 
         Returns:
             Path to cache file
         """
-        # Create hash from documents
-        doc_string = ''.join(documents[:100])  # Use first 100 docs for hash
-        doc_hash = hashlib.md5(doc_string.encode()).hexdigest()
-
-        return self.embedding_cache_dir / f"embeddings_{doc_hash}.joblib"
-
-    def _load_cached_embeddings(self, documents: List[str]) -> Optional[np.ndarray]:
+        # Hash every document as a \x00-separated stream so ["ab"] != ["a", "b"].
+        # Joining and encoding a batch at a time keeps per-document work in C.
+        # The key fields are \x00-delimited too, so no count/model pair can alias.
+        hasher = _new_cache_hasher()
+        variant = "normalized" if normalize_embeddings else "raw"
+        hasher.update(f"{len(documents)}\x00{embedding_model_name}\x00{variant}".encode('utf-8'))
+        batch_size = config.CACHE_HASH_BATCH_DOCS
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start:start + batch_size]
+            hasher.update(("\x00" + "\x00".join(batch)).encode('utf-8'))
+
+        return self.embedding_cache_dir / f"embeddings_{hasher.hexdigest()}.npy"
+
+    def _load_cached_embeddings(
+        self,
+        cache_path: Path,
+        embedding_model_name: str,
+        embedding_dtype: str = "float32",
+        upcast: bool = True,
+    ) -> Optional[np.ndarray]:
         """
         Load cached embeddings if available.
 
+        float32 caches are memory-mapped read-only, so pages are read on
+        demand instead of copying the whole matrix into RAM. Quantized
+        caches are upcast back to float32.
+
         Args:
-            documents: List of documents
+            cache_path: Path from _get_embedding_cache_path()
+            embedding_model_name: Expected embedding model name
+            embedding_dtype: Expected storage dtype ('float32', 'float16', 'int8')
+            upcast: Upcast float16 caches to float32 (False keeps the float16 memmap)
 
         Returns:
             Embeddings array or None if not cached
         """
-        cache_path = self._get_embedding_cache_path(documents)
+        meta_path = cache_path.with_suffix('.json')
 
-        if cache_path.exists():
+        if cache_path.exists() and meta_path.exists():
             try:
-                embeddings = joblib.load(cache_path)
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+
+                if (
+                    meta.get('model_name') != embedding_model_name
+                    or meta.get('dtype') != embedding_dtype
+                ):
+                    self.logger.info(f"Embedding cache does not match request: {cache_path.name}")
+                    return None
+
+                embeddings = np.load(cache_path, mmap_mode='r', allow_pickle=False)
+
+                if (
+                    list(embeddings.shape) != meta.get('shape')
+                    or str(embeddings.dtype) != meta.get('dtype')
+                ):
+                    self.logger.warning(f"Embedding cache header mismatch: {cache_path.name}")
+                    return None
+
+                if embedding_dtype == "int8":
+                    scales = np.load(cache_path.with_suffix('.scale.npy'), allow_pickle=False)
+                    embeddings = embeddings.astype(np.float32) * scales[:, None]
+                elif embedding_dtype == "float16" and upcast:
+                    embeddings = embeddings.astype(np.float32)
+
                 self.logger.info(f"Loaded embeddings from cache: {cache_path.name}")
                 return embeddings
             except Exception as e:
@@ -215,28 +729,122 @@ class TopicAnalyzer:
 
         return None
 
-    def _save_embeddings_cache(self, documents: List[str], embeddings: np.ndarray) -> None:
+    def _save_embeddings_cache(
+        self,
+        cache_path: Path,
+        embeddings: np.ndarray,
+        embedding_model_name: str,
+        embedding_dtype: str = "float32",
+    ) -> None:
         """
-        Save embeddings to cache.
+        Save embeddings to cache as a raw .npy file plus a JSON header.
 
         Args:
-            documents: List of documents
+            cache_path: Path from _get_embedding_cache_path()
             embeddings: Embeddings array
+            embedding_model_name: Name of embedding model
+            embedding_dtype: Storage dtype ('float32', 'float16', 'int8')
         """
-        cache_path = self._get_embedding_cache_path(documents)
-
         try:
-            joblib.dump(embeddings, cache_path)
-            self.logger.info(f"Saved embeddings to cache: {cache_path.name}")
+            if embedding_dtype == "int8":
+                # Symmetric per-row scalar quantization
+                scales = np.abs(embeddings).max(axis=1).astype(np.float32) / 127.0
+                scales[scales == 0] = 1.0
+                stored = np.clip(np.round(embeddings / scales[:, None]), -127, 127).astype(np.int8)
+                np.save(cache_path.with_suffix('.scale.npy'), scales, allow_pickle=False)
+            elif embedding_dtype == "float16":
+                stored = np.ascontiguousarray(embeddings, dtype=np.float16)
+            else:
+                stored = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+            # Write then rename: a saved model may hard-link the previous file
+            tmp_path = cache_path.with_suffix('.npy.tmp')
+            with open(tmp_path, 'wb') as f:
+                np.save(f, stored, allow_pickle=False)
+            os.replace(tmp_path, cache_path)
+
+            meta = {
+                'shape': list(stored.shape),
+                'dtype': str(stored.dtype),
+                'model_name': embedding_model_name,
+                'corpus_hash': cache_path.stem.replace('embeddings_', ''),
+            }
+            with open(cache_path.with_suffix('.json'), 'w', encoding='utf-8') as f:
+                json.dump(meta, f, indent=2, ensure_ascii=False)
+
+            self.logger.info(f"Saved embeddings to cache: {cache_path.name} ({stored.dtype})")
+            self._enforce_shm_budget()
         except Exception as e:
             self.logger.warning(f"Failed to save embeddings cache: {e}")
 
+    def _compile_embedding_model(self, embedding_model: SentenceTransformer) -> None:
+        """
+        Wrap the transformer backbone with torch.compile (in place, once).
+
+        Loaded models are shared through ModelManager's cache, so the
+        compilation cost is paid once per loaded model. Inductor artifacts
+        are cached under cache_dir/compiled to amortize across runs.
+
+        Args:
+            embedding_model: Loaded SentenceTransformer
+        """
+        if not hasattr(torch, 'compile') or getattr(embedding_model, '_backbone_compiled', False):
+            return
+
+        try:
+            transformer = embedding_model[0]
+            os.environ.setdefault('TORCHINDUCTOR_CACHE_DIR', str(self.cache_dir / 'compiled'))
+            transformer.auto_model = torch.compile(
+                transformer.auto_model,
+                mode=config.EMBEDDING_COMPILE_MODE,
+                dynamic=True,
+            )
+            embedding_model._backbone_compiled = True
+            self.logger.info(f"Compiled embedding backbone (mode={config.EMBEDDING_COMPILE_MODE})")
+        except Exception as e:
+            self.logger.warning(
+                f"torch.compile unavailable for embedding model, using eager mode: {e}"
+            )
+
+    def _auto_batch_size(self, embedding_model: SentenceTransformer) -> int:
+        """
+        Pick an encode batch size from free GPU memory.
+
+        Args:
+            embedding_model: Loaded SentenceTransformer
+
+        Returns:
+            Batch size (config.EMBEDDING_ENCODE_BATCH_SIZE on CPU)
+        """
+        device = embedding_model.device
+        if device.type != 'cuda':
+            return config.EMBEDDING_ENCODE_BATCH_SIZE
+
+        try:
+            free_bytes, _ = torch.cuda.mem_get_info(device)
+        except Exception:
+            return config.EMBEDDING_ENCODE_BATCH_SIZE
+
+        batch_size = int(free_bytes // config.EMBEDDING_BYTES_PER_SAMPLE)
+        batch_size = max(
+            config.EMBEDDING_MIN_BATCH_SIZE, min(config.EMBEDDING_MAX_BATCH_SIZE, batch_size)
+        )
+        self.logger.info(
+            f"Auto-selected encode batch size {batch_size} ({free_bytes / 1024 ** 3:.1f} GB free)"
+        )
+        return batch_size
+
     def generate_embeddings(
         self,
         documents: List[str],
         embedding_model_name: str,
         use_cache: bool = True,
         progress_callback: Optional[Callable[[int, str], None]] = None,
+        embedding_dtype: str = config.DEFAULT_EMBEDDING_CACHE_DTYPE,
+        normalize_embeddings: bool = False,
+        batch_size: Optional[int] = None,
+        device: Optional[str] = None,
+        memmap: bool = False,
     ) -> np.ndarray:
         """
         Generate embeddings for documents.
@@ -246,13 +854,25 @@ class TopicAnalyzer:
             embedding_model_name: Name of embedding model
             use_cache: Whether to use cached embeddings
             progress_callback: Callback(progress_pct, status_msg)
+            embedding_dtype: On-disk cache dtype ('float32', 'float16', 'int8')
+            normalize_embeddings: L2-normalize embeddings (makes cosine a dot product)
+            batch_size: Sentences per forward pass (None: auto from free GPU memory)
+            device: Device to encode on (None: the model manager's device)
+            memmap: Return float32/float16 caches as read-only memory maps in
+                their stored dtype, so only touched pages stay resident
 
         Returns:
             Embeddings array
         """
-        # Check cache
+        # Check cache (hash the corpus once for both lookup and save)
+        cache_path = None
         if use_cache:
-            cached_embeddings = self._load_cached_embeddings(documents)
+            cache_path = self._get_embedding_cache_path(
+                documents, embedding_model_name, normalize_embeddings
+            )
+            cached_embeddings = self._load_cached_embeddings(
+                cache_path, embedding_model_name, embedding_dtype, upcast=not memmap
+            )
             if cached_embeddings is not None:
                 if progress_callback:
                     progress_callback(100, "Loaded embeddings from cache")
@@ -262,10 +882,18 @@ class TopicAnalyzer:
         if progress_callback:
             progress_callback(10, "Loading embedding model...")
 
-        embedding_model = self.model_manager.load_model(
+        # Loaded models are cached per (name, device), so a different device
+        # gets its own manager rather than moving the shared model
+        model_manager = self.model_manager
+        if device is not None and device != model_manager.device:
+            model_manager = ModelManager(cache_dir=self.model_manager.cache_dir, device=device)
+
+        embedding_model = model_manager.load_model(
             embedding_model_name,
             download_if_missing=True,
         )
+        if config.EMBEDDING_TORCH_COMPILE:
+            self._compile_embedding_model(embedding_model)
 
         # Generate embeddings
         if progress_callback:
@@ -273,21 +901,39 @@ class TopicAnalyzer:
 
         self.logger.info(f"Generating embeddings for {len(documents)} documents")
 
-        embeddings = embedding_model.encode(
-            documents,
-            show_progress_bar=True,
-            convert_to_numpy=True,
-        )
+        # encode() already sorts by length internally, so each batch pads to
+        # similar lengths; fp16 autocast halves memory traffic on GPU.
+        use_autocast = str(embedding_model.device).startswith('cuda')
+        if batch_size is None:
+            batch_size = self._auto_batch_size(embedding_model)
+        autocast = torch.autocast('cuda', dtype=torch.float16, enabled=use_autocast)
+        with torch.inference_mode(), autocast:
+            embeddings = embedding_model.encode(
+                documents,
+                batch_size=batch_size,
+                show_progress_bar=True,
+                convert_to_numpy=True,
+                normalize_embeddings=normalize_embeddings,
+            )
 
-        # Convert to float32 to save memory
-        embeddings = embeddings.astype(np.float32)
+        # float32 for UMAP/caching; a no-op unless autocast produced float16
+        embeddings = embeddings.astype(np.float32, copy=False)
 
         if progress_callback:
             progress_callback(90, "Embeddings generated")
 
         # Save to cache
         if use_cache:
-            self._save_embeddings_cache(documents, embeddings)
+            self._save_embeddings_cache(
+                cache_path, embeddings, embedding_model_name, embedding_dtype
+            )
+            if memmap and embedding_dtype != "int8":
+                # Swap the in-RAM array for a map of the file just written
+                cached_embeddings = self._load_cached_embeddings(
+                    cache_path, embedding_model_name, embedding_dtype, upcast=False
+                )
+                if cached_embeddings is not None:
+                    embeddings = cached_embeddings
 
         if progress_callback:
             progress_callback(100, f"Generated embeddings: {embeddings.shape}")
@@ -302,7 +948,7 @@ class TopicAnalyzer:
         embeddings: Optional[np.ndarray] = None,
         params: Optional[TopicModelParams] = None,
         progress_callback: Optional[Callable[[int, str], None]] = None,
-    ) -> Tuple[List[int], Optional[np.ndarray]]:
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
         """
         Train BERTopic model.
 
@@ -313,13 +959,11 @@ class TopicAnalyzer:
             progress_callback: Callback(progress_pct, status_msg)
 
         Returns:
-            Tuple of (topics, probabilities)
+            Tuple of (topics as int32 array, probabilities)
         """
         if params is None:
             params = TopicModelParams()
 
-        self.params = params
-
         try:
             # Generate embeddings if not provided
             if embeddings is None:
@@ -330,19 +974,57 @@ class TopicAnalyzer:
                     documents,
                     params.embedding_model,
                     use_cache=True,
-                    progress_callback=lambda pct, msg: progress_callback(int(pct * 0.3), msg) if progress_callback else None,
+                    embedding_dtype=params.embedding_dtype,
+                    normalize_embeddings=params.umap_metric == 'cosine',
+                    batch_size=params.embedding_batch_size,
+                    progress_callback=(
+                        lambda pct, msg: progress_callback(int(pct * 0.3), msg)
+                        if progress_callback else None
+                    ),
+                    # Retained embeddings map the cache file in its stored
+                    # dtype (float32, or float16 at half the size), so every
+                    # run trains on the values that are kept and saved
+                    memmap=True,
                 )
 
             if progress_callback:
                 progress_callback(30, "Creating BERTopic model...")
 
             # Create sub-models
-            umap_model = self._create_umap_model(params)
-            hdbscan_model = self._create_hdbscan_model(params)
+            # Embeddings may arrive as float16 to save RAM; UMAP/HDBSCAN get float32
+            fit_embeddings = embeddings.astype(np.float32, copy=False)
+            if params.umap_metric == 'cosine':
+                fit_embeddings = self._l2_normalize(fit_embeddings)
+
+            if params.cluster_backend == 'kmeans':
+                self.logger.info(
+                    f"Using IncrementalPCA + MiniBatchKMeans ({params.n_clusters} clusters)"
+                )
+                umap_model, hdbscan_model = self._create_kmeans_models(params)
+            else:
+                use_gpu = self._use_gpu(params)
+                if use_gpu:
+                    self.logger.info("Using cuML GPU backend for UMAP and HDBSCAN")
+                    precomputed_knn = None
+                else:
+                    precomputed_knn = self._get_precomputed_knn(fit_embeddings, params)
+
+                umap_model = self._create_umap_model(
+                    params, precomputed_knn, n_samples=len(embeddings), use_gpu=use_gpu
+                )
+                hdbscan_model = self._create_hdbscan_model(
+                    params, n_samples=len(embeddings), use_gpu=use_gpu
+                )
             vectorizer_model = self._create_vectorizer_model(params)
 
-            # Create BERTopic model
-            self.model = BERTopic(
+            # Create BERTopic model. Embeddings are always passed to fit_transform,
+            # so no embedding backend is attached: topic vectors are averaged from
+            # the document embeddings instead of re-encoding. Any later
+            # transform()/find_topics() call must supply embeddings from the
+            # same model (params.embedding_model).
+            model = BERTopic(
+                embedding_model=None,
+                representation_model=None,
                 umap_model=umap_model,
                 hdbscan_model=hdbscan_model,
                 vectorizer_model=vectorizer_model,
@@ -358,21 +1040,27 @@ class TopicAnalyzer:
 
             self.logger.info("Training BERTopic model...")
 
-            # Fit model
-            topics, probabilities = self.model.fit_transform(documents, embeddings)
-
-            # Store references
-            self.documents = documents
-            self.embeddings = embeddings
-            self.topics = topics
-            self.probabilities = probabilities
-
+            # Fit model into locals; the analyzer's state changes only below
+            topics, probabilities = model.fit_transform(documents, fit_embeddings)
+            topics = np.asarray(topics, dtype=np.int32)
+
+            # Store references together, so the model, its parameters and its
+            # training data always belong to the same run
+            (
+                self.model, self.params, self.documents,
+                self.embeddings, self.topics, self.probabilities,
+            ) = (model, params, documents, embeddings, topics, probabilities)
+            self._reset_visualization_cache()
+
+            # Only HDBSCAN produces the -1 outlier topic (kmeans assigns every document)
+            unique_topics = np.unique(self.topics)
+            n_topics = unique_topics.size - int(unique_topics[0] == -1)
             if progress_callback:
-                progress_callback(100, f"Training complete: {len(set(topics)) - 1} topics found")
+                progress_callback(100, f"Training complete: {n_topics} topics found")
 
-            self.logger.info(f"Training complete: {len(set(topics)) - 1} topics (excluding outliers)")
+            self.logger.info(f"Training complete: {n_topics} topics (excluding outliers)")
 
-            return topics, probabilities
+            return self.topics, probabilities
 
         except Exception as e:
             error_msg = f"Training failed: {e}"
@@ -408,10 +1096,101 @@ class TopicAnalyzer:
         topic = self.model.get_topic(topic_id)
         return topic[:top_n] if topic else []
 
-    def get_document_topics(self) -> Optional[List[int]]:
+    def get_document_topics(self) -> Optional[np.ndarray]:
         """Get topic assignments for all documents."""
         return self.topics
 
+    def _reset_visualization_cache(self) -> None:
+        """Drop cached 2D projections and topic distances."""
+        self._vis_reduced_embeddings = None
+        self._topic_distance_matrix = None
+        self._topic_similarity_matrix = None
+
+    def get_2d_projection(self, embeddings: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get a 2D UMAP projection of document embeddings for plotting.
+
+        The projection of the training embeddings is computed once per
+        trained/loaded model and reused by every scatter visualization.
+        PCA initialization skips the spectral embedding step, which is the
+        slow part of UMAP's setup on large corpora.
+
+        Args:
+            embeddings: Embeddings to project (default: training embeddings)
+
+        Returns:
+            (n_documents, 2) array of coordinates
+
+        Raises:
+            ValueError: If no embeddings are available
+        """
+        use_cache = embeddings is None or embeddings is self.embeddings
+        if use_cache:
+            if self._vis_reduced_embeddings is not None:
+                return self._vis_reduced_embeddings
+            embeddings = self.embeddings
+
+        if embeddings is None:
+            raise ValueError("Embeddings are required to project documents")
+
+        self.logger.info("Reducing embeddings to 2D for visualization...")
+        reduced = UMAP(
+            n_neighbors=10,
+            n_components=2,
+            min_dist=0.0,
+            metric='cosine',
+            init='pca',
+            low_memory=True,
+        ).fit_transform(embeddings)
+
+        if use_cache:
+            self._vis_reduced_embeddings = reduced
+        return reduced
+
+    def get_topic_distance_matrix(self) -> Optional[np.ndarray]:
+        """
+        Get the cosine distance matrix between topic c-TF-IDF vectors.
+
+        Computed once per trained/loaded model; this is the matrix BERTopic's
+        hierarchy visualization builds its linkage from.
+
+        Returns:
+            (n_topics, n_topics) distance matrix including the outlier row,
+            or None if no model is trained
+        """
+        if self._topic_distance_matrix is None:
+            if self.model is None or getattr(self.model, 'c_tf_idf_', None) is None:
+                return None
+            self._topic_distance_matrix = pairwise_distances(
+                self.model.c_tf_idf_, metric='cosine', n_jobs=-1
+            )
+        return self._topic_distance_matrix
+
+    def get_topic_similarity_matrix(self) -> Optional[np.ndarray]:
+        """
+        Get the cosine similarity matrix between topic embeddings.
+
+        Rows are L2-normalized once so the whole matrix is a single GEMM.
+        Falls back to c-TF-IDF vectors when the model has no topic
+        embeddings.
+
+        Returns:
+            (n_topics, n_topics) similarity matrix including the outlier row,
+            or None if no model is trained
+        """
+        if self._topic_similarity_matrix is None:
+            if self.model is None:
+                return None
+            vectors = getattr(self.model, 'topic_embeddings_', None)
+            if vectors is None:
+                vectors = getattr(self.model, 'c_tf_idf_', None)
+                if vectors is None:
+                    return None
+                vectors = vectors.toarray() if sparse.issparse(vectors) else vectors
+            vectors = self._l2_normalize(np.asarray(vectors, dtype=np.float32))
+            self._topic_similarity_matrix = vectors @ vectors.T
+        return self._topic_similarity_matrix
+
     def save_model(self, save_path: Optional[Path] = None, name: str = "bertopic_model") -> Path:
         """
         Save BERTopic model and metadata.
@@ -433,23 +1212,31 @@ class TopicAnalyzer:
         try:
             # Save BERTopic model
             model_file = model_dir / "model"
-            self.model.save(str(model_file), serialization="pickle", save_ctfidf=True, save_embedding_model=False)
+            self.model.save(
+                str(model_file),
+                serialization="pickle",
+                save_ctfidf=True,
+                save_embedding_model=False,
+            )
 
             # Save parameters
             params_file = model_dir / "params.json"
-            import json
             with open(params_file, 'w', encoding='utf-8') as f:
                 json.dump(self.params.to_dict(), f, indent=2)
 
             # Save topics
             if self.topics is not None:
                 topics_file = model_dir / "topics.joblib"
-                joblib.dump(self.topics, topics_file)
+                joblib.dump(
+                    self.topics,
+                    topics_file,
+                    compress=JOBLIB_COMPRESS,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
 
-            # Save embeddings (optional)
+            # Save embeddings (optional); raw .npy so load_model can memory-map it
             if self.embeddings is not None:
-                embeddings_file = model_dir / "embeddings.joblib"
-                joblib.dump(self.embeddings, embeddings_file)
+                self._save_model_embeddings(model_dir / "embeddings.npy")
 
             self.logger.info(f"Model saved to: {model_dir}")
 
@@ -460,6 +1247,61 @@ class TopicAnalyzer:
             self.logger.error(error_msg)
             raise
 
+    def _find_cached_embeddings_file(self) -> Optional[Path]:
+        """Return the float32 cache file holding self.embeddings, if there is one."""
+        if isinstance(self.embeddings, np.memmap) and self.embeddings.filename:
+            source = Path(self.embeddings.filename)
+            if self.embeddings.dtype == np.float32 and source.parent == self.embedding_cache_dir:
+                return source
+
+        if self.documents is None or self.params is None:
+            return None
+
+        cache_path = self._get_embedding_cache_path(
+            self.documents,
+            self.params.embedding_model,
+            self.params.umap_metric == 'cosine',
+        )
+        meta_path = cache_path.with_suffix('.json')
+        if not (cache_path.exists() and meta_path.exists()):
+            return None
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if meta.get('dtype') == 'float32' and meta.get('shape') == list(self.embeddings.shape):
+            return cache_path
+        return None
+
+    def _save_model_embeddings(self, embeddings_file: Path) -> None:
+        """
+        Save embeddings for a model, hard-linking the embedding cache when possible.
+
+        The cache already holds the same float32 .npy, so a hard link avoids
+        a second copy on disk; copy2 covers cross-filesystem caches (shm).
+        """
+        if embeddings_file.exists():
+            embeddings_file.unlink()
+
+        source = self._find_cached_embeddings_file()
+        if source is not None:
+            try:
+                os.link(source, embeddings_file)
+                self.logger.debug(f"Hard-linked embeddings from cache: {source.name}")
+                return
+            except OSError:
+                shutil.copy2(source, embeddings_file)
+                return
+
+        np.save(
+            embeddings_file,
+            np.ascontiguousarray(self.embeddings, dtype=np.float32),
+            allow_pickle=False,
+        )
+
     def load_model(self, model_path: Path) -> None:
         """
         Load BERTopic model and metadata.
@@ -471,11 +1313,11 @@ class TopicAnalyzer:
             # Load BERTopic model
             model_file = model_path / "model"
             self.model = BERTopic.load(str(model_file))
+            self._reset_visualization_cache()
 
             # Load parameters
             params_file = model_path / "params.json"
             if params_file.exists():
-                import json
                 with open(params_file, 'r', encoding='utf-8') as f:
                     params_dict = json.load(f)
                 self.params = TopicModelParams.from_dict(params_dict)
@@ -483,12 +1325,15 @@ class TopicAnalyzer:
             # Load topics
             topics_file = model_path / "topics.joblib"
             if topics_file.exists():
-                self.topics = joblib.load(topics_file)
+                self.topics = np.asarray(joblib.load(topics_file), dtype=np.int32)
 
-            # Load embeddings
-            embeddings_file = model_path / "embeddings.joblib"
+            # Load embeddings (embeddings.joblib from older saves)
+            embeddings_file = model_path / "embeddings.npy"
+            legacy_embeddings_file = model_path / "embeddings.joblib"
             if embeddings_file.exists():
-                self.embeddings = joblib.load(embeddings_file)
+                self.embeddings = np.load(embeddings_file, mmap_mode='r', allow_pickle=False)
+            elif legacy_embeddings_file.exists():
+                self.embeddings = joblib.load(legacy_embeddings_file)
 
             self.logger.info(f"Model loaded from: {model_path}")
 
@@ -3,17 +3,28 @@ BERTopic Pro - Visualization Generator
 Generates interactive Plotly visualizations for BERTopic models.
 """
 
+import io
+import base64
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple, TYPE_CHECKING
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from sklearn.metrics import pairwise_distances
 
 from app.utils.logger import get_logger
-from app.core.topic_analyzer import TopicAnalyzer
+from app.utils.figure_export import write_figure, IMAGE_FORMATS
 import config
 
+# plotly and datashader are imported on first use so that importing this
+# module (done by the main window at startup) stays cheap
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+    from app.core.topic_analyzer import TopicAnalyzer
+
+DATASHADER_AVAILABLE = importlib.util.find_spec("datashader") is not None
+
 
 logger = get_logger(__name__)
 
@@ -32,9 +43,37 @@ class VisualizationGenerator:
     - HTML export
     """
 
+    # id -> (name, description, method name); order is the UI list order
+    _VIS_REGISTRY: Dict[str, Tuple[str, str, str]] = {
+        'topics': (
+            '主题间距离图', '显示主题在二维空间中的分布和相似度', 'visualize_topics'
+        ),
+        'hierarchy': (
+            '主题层次聚类', '显示主题的层次结构和关系', 'visualize_hierarchy'
+        ),
+        'barchart': (
+            '主题关键词得分', '显示每个主题的关键词及其重要性得分', 'visualize_barchart'
+        ),
+        'documents': (
+            '文档投影图', '显示文档在降维空间中的分布', 'visualize_documents'
+        ),
+        'heatmap': (
+            '主题相似度热力图', '显示主题之间的相似度矩阵', 'visualize_heatmap'
+        ),
+        'term_rank': (
+            '主题词排序', '显示主题词的排序和分布', 'visualize_term_rank'
+        ),
+        'topics_over_time': (
+            '主题时间演化', '显示主题随时间的变化趋势', 'visualize_topics_over_time'
+        ),
+    }
+
+    # Views that run UMAP (BERTopic's topic map, the 2D document projection)
+    _UMAP_VIEWS = frozenset({'topics', 'documents'})
+
     def __init__(
         self,
-        topic_analyzer: TopicAnalyzer,
+        topic_analyzer: "TopicAnalyzer",
         font_family: str = "Noto Sans CJK SC, Microsoft YaHei, SimHei, sans-serif",
     ):
         """
@@ -53,6 +92,9 @@ class VisualizationGenerator:
         self.model = topic_analyzer.model
         self.font_family = font_family
 
+        # Built on first get_available_visualizations() call
+        self._visualizations: Optional[List[Dict[str, Any]]] = None
+
         # Default layout settings
         self.default_layout = {
             'font': {'family': font_family, 'size': 12},
@@ -62,7 +104,7 @@ class VisualizationGenerator:
 
         self.logger.info("VisualizationGenerator initialized")
 
-    def _apply_layout(self, fig: go.Figure, title: str, **kwargs) -> go.Figure:
+    def _apply_layout(self, fig: "go.Figure", title: str, **kwargs) -> "go.Figure":
         """
         Apply default layout to figure.
 
@@ -80,8 +122,49 @@ class VisualizationGenerator:
             **kwargs,
         }
 
-        fig.update_layout(**layout_updates)
+        # Leave unchanged sizes alone to avoid relayout work on large figures
+        layout_updates = {
+            key: value for key, value in layout_updates.items()
+            if not (key in ('width', 'height') and fig.layout[key] == value)
+        }
+
+        # update_layout merges into existing compound properties (e.g. the
+        # title position BERTopic sets); batching validates the figure once
+        with fig.batch_update():
+            fig.update_layout(**layout_updates)
+
+        return fig
+
+    def _to_webgl(self, fig: "go.Figure") -> "go.Figure":
+        """
+        Convert SVG scatter traces to WebGL (Scattergl) for large point counts.
+
+        Args:
+            fig: Plotly figure
+
+        Returns:
+            Figure with scatter traces converted if above SCATTERGL_MIN_POINTS
+        """
+        n_points = sum(
+            len(trace.x) for trace in fig.data
+            if trace.type == 'scatter' and trace.x is not None
+        )
+        if n_points < config.SCATTERGL_MIN_POINTS:
+            return fig
+
+        import plotly.graph_objects as go
+
+        traces = []
+        for trace in fig.data:
+            if trace.type == 'scatter':
+                props = trace.to_plotly_json()
+                props.pop('type', None)
+                trace = go.Scattergl(props, skip_invalid=True)
+            traces.append(trace)
+        fig.data = ()
+        fig.add_traces(traces)
 
+        self.logger.debug(f"Rendering {n_points} points with Scattergl")
         return fig
 
     def visualize_topics(
@@ -89,7 +172,7 @@ class VisualizationGenerator:
         top_n_topics: Optional[int] = None,
         width: int = 800,
         height: int = 800,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Generate intertopic distance map.
 
@@ -110,6 +193,7 @@ class VisualizationGenerator:
                 width=width,
                 height=height,
             )
+            fig = self._to_webgl(fig)
 
             # Apply custom layout
             fig = self._apply_layout(
@@ -132,7 +216,7 @@ class VisualizationGenerator:
         orientation: str = "left",
         width: int = 1000,
         height: int = 600,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Generate hierarchical clustering dendrogram.
 
@@ -150,6 +234,7 @@ class VisualizationGenerator:
             # Use BERTopic's built-in visualization
             fig = self.model.visualize_hierarchy(
                 orientation=orientation,
+                distance_function=self._topic_distance_function,
                 width=width,
                 height=height,
             )
@@ -177,7 +262,7 @@ class VisualizationGenerator:
         n_words: int = 10,
         width: int = 800,
         height: int = 600,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Generate topic word scores bar chart.
 
@@ -191,17 +276,42 @@ class VisualizationGenerator:
         Returns:
             Plotly figure
         """
+        import plotly.express as px
+
         try:
             self.logger.info("Generating topic word scores bar chart...")
 
-            # Use BERTopic's built-in visualization
-            fig = self.model.visualize_barchart(
-                topics=topics,
-                top_n_topics=top_n_topics,
-                n_words=n_words,
-                width=width,
-                height=height,
+            if topics is None:
+                freq = self.model.get_topic_freq()
+                topics = freq.loc[freq.Topic != -1, 'Topic'].head(top_n_topics).tolist()
+
+            # Built as one faceted px.bar from get_topic() rather than
+            # BERTopic's per-topic make_subplots figure
+            records = [
+                {'topic': f"Topic {topic}", 'word': word, 'score': score}
+                for topic in topics
+                for word, score in (self.model.get_topic(topic) or [])[:n_words]
+            ]
+            if not records:
+                raise ValueError("No topic words available for the bar chart")
+
+            # Row spacing as in BERTopic; plotly rejects the default beyond ~15 rows
+            n_columns = 4
+            n_rows = int(np.ceil(len(topics) / n_columns))
+            fig = px.bar(
+                pd.DataFrame(records, columns=['topic', 'word', 'score']),
+                x='score',
+                y='word',
+                orientation='h',
+                facet_col='topic',
+                facet_col_wrap=n_columns,
+                facet_col_spacing=0.08,
+                facet_row_spacing=0.4 / n_rows if n_rows > 1 else 0,
             )
+            # Each topic has its own words; highest score on top
+            fig.update_yaxes(matches=None, showticklabels=True, autorange='reversed', title=None)
+            fig.update_xaxes(title=None)
+            fig.for_each_annotation(lambda a: a.update(text=a.text.split('=', 1)[-1]))
 
             # Apply custom layout
             fig = self._apply_layout(
@@ -229,7 +339,7 @@ class VisualizationGenerator:
         hide_annotations: bool = False,
         width: int = 1000,
         height: int = 800,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Generate document projection visualization.
 
@@ -262,16 +372,32 @@ class VisualizationGenerator:
             if docs is None or topics is None:
                 raise ValueError("No documents or topics available for visualization")
 
-            # Use BERTopic's built-in visualization
-            fig = self.model.visualize_documents(
-                docs=docs,
-                topics=topics,
-                embeddings=embeddings,
-                reduced_embeddings=reduced_embeddings,
-                sample=sample,
-                hide_annotations=hide_annotations,
-                width=width,
-                height=height,
+            # Reuse the 2D projection across calls; UMAP dominates this plot
+            if reduced_embeddings is None:
+                reduced_embeddings = self.topic_analyzer.get_2d_projection(embeddings)
+            topics = np.asarray(topics)
+
+            # Very large corpora are rasterized instead of drawn point by point
+            if len(docs) > config.RASTERIZE_THRESHOLD:
+                if DATASHADER_AVAILABLE:
+                    return self.visualize_documents_rasterized(
+                        reduced_embeddings, topics, width=width, height=height
+                    )
+                self.logger.warning("datashader not installed, plotting all documents as points")
+
+            # Cap the point count with a seeded per-topic sample
+            if sample is None and len(docs) > config.DOCUMENT_PLOT_MAX_POINTS:
+                sample = config.DOCUMENT_PLOT_MAX_POINTS / len(docs)
+            if sample is not None and sample < 1:
+                indices = self._sample_document_indices(topics, sample)
+                self.logger.info(
+                    f"Plotting a {sample:.1%} per-topic sample of {len(docs)} documents"
+                )
+            else:
+                indices = np.arange(len(docs))
+
+            fig = self._documents_figure(
+                docs, topics, reduced_embeddings, indices, hide_annotations
             )
 
             # Apply custom layout
@@ -290,6 +416,214 @@ class VisualizationGenerator:
             self.logger.error(f"Failed to generate document projection: {e}")
             raise
 
+    @staticmethod
+    def _sample_document_indices(topics: np.ndarray, sample: float) -> np.ndarray:
+        """
+        Draw a reproducible per-topic sample of document indices.
+
+        Follows BERTopic's rule (topics under 100 documents are kept whole,
+        larger ones are sampled to the given fraction), with a generator
+        seeded from config.RANDOM_SEED so every call picks the same points.
+
+        Args:
+            topics: Topic assignment per document
+            sample: Fraction of documents to keep per topic
+
+        Returns:
+            Sorted indices of the sampled documents
+        """
+        rng = np.random.default_rng(config.RANDOM_SEED)
+        indices = []
+        for topic in np.unique(topics):
+            members = np.flatnonzero(topics == topic)
+            if len(members) >= 100:
+                members = rng.choice(members, size=int(len(members) * sample), replace=False)
+            indices.append(members)
+        return np.sort(np.concatenate(indices))
+
+    def _documents_figure(
+        self,
+        docs: List[str],
+        topics: np.ndarray,
+        reduced_embeddings: np.ndarray,
+        indices: np.ndarray,
+        hide_annotations: bool,
+    ) -> "go.Figure":
+        """
+        Build the document scatter for the documents at the given indices.
+
+        One Scattergl trace per topic, styled like BERTopic's plot. Only the
+        selected rows are indexed, so a sample never has to line up with
+        the model's full topics_.
+
+        Args:
+            docs: All documents
+            topics: Topic assignment per document
+            reduced_embeddings: 2D coordinates per document
+            indices: Documents to plot
+            hide_annotations: Whether to hide topic labels at the centroids
+
+        Returns:
+            Plotly figure
+        """
+        import plotly.graph_objects as go
+
+        coords = np.asarray(reduced_embeddings)[indices]
+        sampled_topics = topics[indices]
+        hover = [docs[i] for i in indices]
+
+        fig = go.Figure()
+        for topic in np.unique(sampled_topics).tolist():
+            rows = np.flatnonzero(sampled_topics == topic)
+            x, y = coords[rows, 0], coords[rows, 1]
+
+            if topic == -1:
+                name = "other"
+                marker = {'color': '#CFD8DC', 'size': 5, 'opacity': 0.5}
+            else:
+                words = [word for word, _ in (self.model.get_topic(topic) or [])[:3]]
+                name = f"{topic}_" + "_".join(words)
+                marker = {'size': 5, 'opacity': 0.5}
+
+            fig.add_trace(go.Scattergl(
+                x=x,
+                y=y,
+                hovertext=[hover[i] for i in rows],
+                hoverinfo='text',
+                mode='markers',
+                name=name,
+                showlegend=topic != -1,
+                marker=marker,
+            ))
+
+            if not hide_annotations and topic != -1:
+                fig.add_annotation(
+                    x=float(x.mean()), y=float(y.mean()), text=name,
+                    showarrow=False, font={'size': 12},
+                )
+
+        fig.update_xaxes(visible=False)
+        fig.update_yaxes(visible=False)
+        return fig
+
+    def _topic_distance_function(self, topic_vectors) -> np.ndarray:
+        """
+        Distance function for visualize_hierarchy backed by the analyzer's cache.
+
+        BERTopic passes the c-TF-IDF rows after the outlier topic; anything
+        else falls back to computing cosine distances directly.
+        """
+        distances = self.topic_analyzer.get_topic_distance_matrix()
+        offset = getattr(self.model, '_outliers', 0)
+        if distances is not None and topic_vectors.shape[0] == distances.shape[0] - offset:
+            return distances[offset:, offset:]
+        return pairwise_distances(topic_vectors, metric='cosine')
+
+    def visualize_documents_rasterized(
+        self,
+        reduced_embeddings: np.ndarray,
+        topics: List[int],
+        width: int = 1000,
+        height: int = 800,
+    ) -> "go.Figure":
+        """
+        Generate a rasterized document projection with datashader.
+
+        Points are aggregated per pixel into an image, so browser memory is
+        bounded by the canvas size rather than the number of documents.
+        Topic centroids are overlaid as markers for hover labels.
+
+        Args:
+            reduced_embeddings: 2D document coordinates
+            topics: Topic assignments
+            width: Figure width
+            height: Figure height
+
+        Returns:
+            Plotly figure
+        """
+        if not DATASHADER_AVAILABLE:
+            raise ImportError("datashader is required for rasterized projections")
+
+        import datashader as ds
+        import datashader.transfer_functions as tf
+        import plotly.colors
+        import plotly.graph_objects as go
+
+        try:
+            self.logger.info(f"Rasterizing {len(topics)} documents...")
+
+            topics = np.asarray(topics)
+            df = pd.DataFrame({
+                'x': reduced_embeddings[:, 0],
+                'y': reduced_embeddings[:, 1],
+                'topic': pd.Categorical(topics.astype(str)),
+            })
+
+            # One color per topic, outliers in light grey
+            palette = plotly.colors.qualitative.Alphabet
+            color_key = {
+                topic: '#CFD8DC' if topic == '-1' else palette[i % len(palette)]
+                for i, topic in enumerate(df['topic'].cat.categories)
+            }
+
+            x_range = (float(df['x'].min()), float(df['x'].max()))
+            y_range = (float(df['y'].min()), float(df['y'].max()))
+            canvas = ds.Canvas(
+                plot_width=width, plot_height=height, x_range=x_range, y_range=y_range
+            )
+            agg = canvas.points(df, 'x', 'y', ds.count_cat('topic'))
+            image = tf.shade(agg, color_key=color_key, how='eq_hist').to_pil()
+
+            buffer = io.BytesIO()
+            image.save(buffer, format='png')
+            source = "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+            fig = go.Figure()
+            fig.add_layout_image(
+                source=source,
+                xref='x',
+                yref='y',
+                x=x_range[0],
+                y=y_range[1],
+                sizex=x_range[1] - x_range[0],
+                sizey=y_range[1] - y_range[0],
+                sizing='stretch',
+                layer='below',
+            )
+
+            # Centroid overlay for hover/annotation
+            centroids = df[df['topic'] != '-1'].groupby('topic', observed=True)[['x', 'y']].mean()
+            topic_labels = getattr(self.model, 'topic_labels_', None) or {}
+            fig.add_trace(go.Scattergl(
+                x=centroids['x'],
+                y=centroids['y'],
+                mode='markers+text',
+                text=[topic_labels.get(int(t), t) for t in centroids.index],
+                textposition='top center',
+                marker={'size': 6, 'color': 'black'},
+                hoverinfo='text',
+                showlegend=False,
+            ))
+
+            fig.update_xaxes(range=x_range, visible=False)
+            fig.update_yaxes(range=y_range, visible=False)
+
+            fig = self._apply_layout(
+                fig,
+                title="文档投影图 (Documents Projection)",
+                width=width,
+                height=height,
+            )
+
+            self.logger.info("Rasterized document projection generated")
+
+            return fig
+
+        except Exception as e:
+            self.logger.error(f"Failed to rasterize document projection: {e}")
+            raise
+
     def visualize_topics_over_time(
         self,
         topics_over_time: pd.DataFrame,
@@ -297,7 +631,7 @@ class VisualizationGenerator:
         normalize_frequency: bool = False,
         width: int = 1000,
         height: int = 600,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Generate topics over time visualization.
 
@@ -346,7 +680,7 @@ class VisualizationGenerator:
         n_clusters: int = 10,
         width: int = 800,
         height: int = 800,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Generate topic similarity heatmap.
 
@@ -360,17 +694,61 @@ class VisualizationGenerator:
         Returns:
             Plotly figure
         """
+        import plotly.graph_objects as go
+
         try:
             self.logger.info("Generating topic similarity heatmap...")
 
-            # Use BERTopic's built-in visualization
-            fig = self.model.visualize_heatmap(
-                topics=topics,
-                top_n_topics=top_n_topics,
-                n_clusters=n_clusters,
-                width=width,
-                height=height,
-            )
+            similarity = self.topic_analyzer.get_topic_similarity_matrix()
+            if similarity is None:
+                # Same fallback as before for models without usable vectors
+                fig = self.model.visualize_heatmap(
+                    topics=topics,
+                    top_n_topics=top_n_topics,
+                    n_clusters=n_clusters,
+                    width=width,
+                    height=height,
+                )
+            else:
+                if topics is None:
+                    freq = self.model.get_topic_freq()
+                    topics = freq.loc[freq.Topic != -1, 'Topic'].tolist()
+                    if top_n_topics:
+                        topics = topics[:top_n_topics]
+                topics = sorted(topics)
+
+                # Slice the cached matrix instead of recomputing similarities
+                offset = getattr(self.model, '_outliers', 0)
+                indices = np.asarray(topics) + offset
+                sim = similarity[np.ix_(indices, indices)]
+
+                # Group topics by hierarchical cluster, as BERTopic does
+                if n_clusters:
+                    if n_clusters >= len(topics):
+                        raise ValueError(
+                            "Make sure to set `n_clusters` lower than the number of topics"
+                        )
+                    from scipy.cluster.hierarchy import linkage, fcluster
+
+                    clusters = fcluster(linkage(sim, 'ward'), t=n_clusters, criterion='maxclust')
+                    order = np.argsort(clusters, kind='stable')
+                    topics = [topics[i] for i in order]
+                    sim = sim[np.ix_(order, order)]
+
+                labels = []
+                for topic in topics:
+                    words = [word for word, _ in (self.model.get_topic(topic) or [])[:3]]
+                    labels.append(f"{topic}_" + "_".join(words))
+
+                fig = go.Figure(go.Heatmap(
+                    z=sim,
+                    x=labels,
+                    y=labels,
+                    colorscale='GnBu',
+                    colorbar={'title': 'Similarity Score'},
+                ))
+                fig.update_xaxes(showgrid=False)
+                fig.update_yaxes(showgrid=False, autorange='reversed')
 
             # Apply custom layout
             fig = self._apply_layout(
@@ -394,7 +772,7 @@ class VisualizationGenerator:
         log_scale: bool = False,
         width: int = 800,
         height: int = 500,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Generate term rank visualization.
 
@@ -436,7 +814,7 @@ class VisualizationGenerator:
 
     def save_figure(
         self,
-        fig: go.Figure,
+        fig: "go.Figure",
         filepath: Path,
         format: str = "html",
         include_plotlyjs: str = "cdn",
@@ -453,81 +831,105 @@ class VisualizationGenerator:
         try:
             filepath = Path(filepath)
 
-            if format == "html":
-                fig.write_html(
-                    str(filepath),
-                    include_plotlyjs=include_plotlyjs,
-                    config={'displayModeBar': True, 'responsive': True},
-                )
-
-                self.logger.info(f"Figure saved to HTML: {filepath}")
+            if format != "html" and format not in IMAGE_FORMATS:
+                raise ValueError(f"Unsupported format: {format}")
 
-            elif format in ["png", "jpeg", "svg", "pdf"]:
-                # Requires kaleido
-                fig.write_image(str(filepath), format=format)
+            write_figure(fig, filepath, format, include_plotlyjs)
 
-                self.logger.info(f"Figure saved to {format.upper()}: {filepath}")
-
-            else:
-                raise ValueError(f"Unsupported format: {format}")
+            self.logger.info(f"Figure saved to {format.upper()}: {filepath}")
 
         except Exception as e:
             self.logger.error(f"Failed to save figure: {e}")
             raise
 
-    def get_available_visualizations(self) -> List[Dict[str, Any]]:
+    def generate_all(self, ids: Optional[List[str]] = None) -> Dict[str, "go.Figure"]:
         """
-        Get list of available visualizations.
+        Generate several visualizations concurrently.
+
+        The BERTopic plots are independent and spend most of their time in
+        numpy/scipy code that releases the GIL, so they overlap well in
+        threads. Shared inputs (topic distances and similarities) are
+        computed up front. The UMAP-backed views run one after the other in
+        the calling thread, since UMAP's numba kernels abort when several
+        threads enter them at once.
+
+        Args:
+            ids: Visualization ids (default: all that need no extra input)
 
         Returns:
-            List of visualization metadata
+            Dict of id -> figure for the visualizations that succeeded
         """
-        visualizations = [
-            {
-                'id': 'topics',
-                'name': '主题间距离图',
-                'description': '显示主题在二维空间中的分布和相似度',
-                'method': self.visualize_topics,
-            },
-            {
-                'id': 'hierarchy',
-                'name': '主题层次聚类',
-                'description': '显示主题的层次结构和关系',
-                'method': self.visualize_hierarchy,
-            },
-            {
-                'id': 'barchart',
-                'name': '主题关键词得分',
-                'description': '显示每个主题的关键词及其重要性得分',
-                'method': self.visualize_barchart,
-            },
-            {
-                'id': 'documents',
-                'name': '文档投影图',
-                'description': '显示文档在降维空间中的分布',
-                'method': self.visualize_documents,
-            },
-            {
-                'id': 'heatmap',
-                'name': '主题相似度热力图',
-                'description': '显示主题之间的相似度矩阵',
-                'method': self.visualize_heatmap,
-            },
-            {
-                'id': 'term_rank',
-                'name': '主题词排序',
-                'description': '显示主题词的排序和分布',
-                'method': self.visualize_term_rank,
-            },
+        # topics_over_time needs a precomputed topics_over_time DataFrame
+        ids = [
+            viz_id for viz_id in (ids or list(self._VIS_REGISTRY))
+            if viz_id in self._VIS_REGISTRY and viz_id != 'topics_over_time'
         ]
+        if not ids:
+            return {}
 
-        # Add topics over time if timestamps are available
-        if self.topic_analyzer.documents is not None:
-            visualizations.append({
-                'id': 'topics_over_time',
-                'name': '主题时间演化',
-                'description': '显示主题随时间的变化趋势',
-                'method': self.visualize_topics_over_time,
-            })
+        # Compute once before the threads race to fill the caches
+        self.topic_analyzer.get_topic_distance_matrix()
+        self.topic_analyzer.get_topic_similarity_matrix()
+
+        results: Dict[str, "go.Figure"] = {}
+
+        def collect(viz_id: str, get_figure: Callable[[], "go.Figure"]) -> None:
+            try:
+                results[viz_id] = get_figure()
+            except Exception as e:
+                self.logger.error(f"Failed to generate visualization '{viz_id}': {e}")
+
+        pooled_ids = [viz_id for viz_id in ids if viz_id not in self._UMAP_VIEWS]
+        if pooled_ids:
+            with ThreadPoolExecutor(max_workers=min(6, len(pooled_ids))) as executor:
+                futures = {
+                    viz_id: executor.submit(self.get_method(viz_id)) for viz_id in pooled_ids
+                }
+                for viz_id, future in futures.items():
+                    collect(viz_id, future.result)
+
+        for viz_id in ids:
+            if viz_id in self._UMAP_VIEWS:
+                collect(viz_id, self.get_method(viz_id))
 
-        return visualizations
+        figures = {viz_id: results[viz_id] for viz_id in ids if viz_id in results}
+        self.logger.info(f"Generated {len(figures)}/{len(ids)} visualizations")
+
+        return figures
+
+    def get_method(self, viz_id: str) -> Callable[..., "go.Figure"]:
+        """
+        Get the visualize_* method for a visualization id.
+
+        Args:
+            viz_id: Visualization id (key of _VIS_REGISTRY)
+
+        Returns:
+            Bound method
+
+        Raises:
+            KeyError: If the id is unknown
+        """
+        return getattr(self, self._VIS_REGISTRY[viz_id][2])
+
+    def get_available_visualizations(self) -> List[Dict[str, Any]]:
+        """
+        Get list of available visualizations.
+
+        Returns:
+            List of visualization metadata
+        """
+        if self._visualizations is None:
+            # Topics over time needs the training documents
+            self._visualizations = [
+                {
+                    'id': viz_id,
+                    'name': name,
+                    'description': description,
+                    'method': getattr(self, method_name),
+                }
+                for viz_id, (name, description, method_name) in self._VIS_REGISTRY.items()
+                if viz_id != 'topics_over_time' or self.topic_analyzer.documents is not None
+            ]
+
+        return self._visualizations
@@ -3,6 +3,8 @@ BERTopic Pro - Base Worker Class
 Abstract base class for all QThread workers in the application.
 """
 
+import threading
+import time
 from typing import Any, Optional
 from PySide6.QtCore import QObject, Signal
 from app.utils.logger import get_logger
@@ -27,12 +29,20 @@ class BaseWorker(QObject):
     finished = Signal(object)  # Result object
     error = Signal(Exception)  # Exception object
 
+    # Upper bound on progress signal rate
+    PROGRESS_MAX_HZ = 20  # one emission per 50 ms
+
     def __init__(self):
         """Initialize the base worker."""
         super().__init__()
 
-        # Cancellation flag
-        self._is_cancelled = False
+        # Cancellation flag, set from the UI thread and polled by the worker
+        self._cancel_event = threading.Event()
+
+        # Progress/status coalescing (see emit_progress / emit_status)
+        self._last_emit = 0.0
+        self._last_value = -1
+        self._last_status: Optional[str] = None
 
         # Logger
         self.logger = get_logger(self.__class__.__name__)
@@ -46,7 +56,7 @@ class BaseWorker(QObject):
         Must be implemented by subclasses. This method will be executed in a separate thread.
 
         The implementation should:
-        1. Check self._is_cancelled periodically
+        1. Check self.is_cancelled() periodically
         2. Emit progress signals
         3. Emit status signals
         4. Emit finished signal with result on success
@@ -60,7 +70,7 @@ class BaseWorker(QObject):
 
         Sets the cancellation flag which should be checked in the run() method.
         """
-        self._is_cancelled = True
+        self._cancel_event.set()
         self.logger.info(f"{self.__class__.__name__} cancellation requested")
         self.status.emit("Cancelling...")
 
@@ -71,19 +81,29 @@ class BaseWorker(QObject):
         Returns:
             True if cancelled, False otherwise
         """
-        return self._is_cancelled
+        return self._cancel_event.is_set()
 
     def emit_progress(self, value: int, message: Optional[str] = None):
         """
         Emit progress signal with optional status message.
 
+        Progress emissions are rate-limited to PROGRESS_MAX_HZ so per-batch
+        callbacks don't flood the UI event loop; completion (100) always goes
+        through. Messages are never throttled (emit_status drops repeats).
+
         Args:
             value: Progress value (0-100)
             message: Optional status message
         """
         # Clamp value to 0-100
         value = max(0, min(100, value))
-        self.progress.emit(value)
+
+        now = time.monotonic()
+        throttled = value < 100 and now - self._last_emit < 1.0 / self.PROGRESS_MAX_HZ
+        if not throttled and value != self._last_value:
+            self._last_emit = now
+            self._last_value = value
+            self.progress.emit(value)
 
         if message:
             self.emit_status(message)
@@ -92,9 +112,15 @@ class BaseWorker(QObject):
         """
         Emit status signal.
 
+        Repeated identical messages are emitted only once.
+
         Args:
             message: Status message
         """
+        if message == self._last_status:
+            return
+
+        self._last_status = message
         self.status.emit(message)
         self.logger.info(message)
 
@@ -115,7 +141,7 @@ class BaseWorker(QObject):
         Args:
             result: Result object (can be None)
         """
-        if not self._is_cancelled:
+        if not self._cancel_event.is_set():
             self.finished.emit(result)
             self.logger.info(f"{self.__class__.__name__} completed successfully")
         else:
@@ -22,6 +22,9 @@ class BertopicWorker(BaseWorker):
         topic_analyzer: TopicAnalyzer,
         params: Optional[TopicModelParams] = None,
         embeddings: Optional[np.ndarray] = None,
+        use_gpu: bool = True,
+        cluster_backend: Optional[str] = None,
+        n_topics: Optional[int] = None,
     ):
         """
         Initialize BERTopic worker.
@@ -31,6 +34,9 @@ class BertopicWorker(BaseWorker):
             topic_analyzer: TopicAnalyzer instance
             params: Model parameters (uses defaults if None)
             embeddings: Pre-computed embeddings (generates if None)
+            use_gpu: Allow cuML GPU UMAP/HDBSCAN when available (False forces CPU)
+            cluster_backend: Override params.cluster_backend ('hdbscan' or 'kmeans')
+            n_topics: Override params.n_clusters for the kmeans backend
         """
         super().__init__()
 
@@ -38,6 +44,9 @@ class BertopicWorker(BaseWorker):
         self.topic_analyzer = topic_analyzer
         self.params = params
         self.embeddings = embeddings
+        self.use_gpu = use_gpu
+        self.cluster_backend = cluster_backend
+        self.n_topics = n_topics
 
     def run(self):
         """Train BERTopic model."""
@@ -46,19 +55,30 @@ class BertopicWorker(BaseWorker):
             self.emit_progress(0, "Initializing...")
 
             def progress_callback(pct, msg):
-                if not self._is_cancelled:
+                if not self.is_cancelled():
                     self.emit_progress(pct, msg)
-                    self.emit_status(msg)
+
+            # GPU use is resolved by params.backend ('auto' picks cuML if present)
+            params = self.params or TopicModelParams()
+            overrides = {}
+            if not self.use_gpu:
+                overrides['backend'] = 'cpu'
+            if self.cluster_backend is not None:
+                overrides['cluster_backend'] = self.cluster_backend
+            if self.n_topics is not None:
+                overrides['n_clusters'] = self.n_topics
+            if overrides:
+                params = TopicModelParams.from_dict({**params.to_dict(), **overrides})
 
             # Train model
             topics, probabilities = self.topic_analyzer.train(
                 documents=self.documents,
                 embeddings=self.embeddings,
-                params=self.params,
+                params=params,
                 progress_callback=progress_callback,
             )
 
-            if self._is_cancelled:
+            if self.is_cancelled():
                 self.emit_status("Training cancelled")
                 return
 
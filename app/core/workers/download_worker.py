@@ -42,9 +42,8 @@ class DownloadWorker(BaseWorker):
             self.emit_progress(0, "Starting download...")
 
             def progress_callback(pct, msg):
-                if not self._is_cancelled:
+                if not self.is_cancelled():
                     self.emit_progress(pct, msg)
-                    self.emit_status(msg)
 
             # Download model
             model_path = self.model_manager.download_model(
@@ -53,7 +52,7 @@ class DownloadWorker(BaseWorker):
                 force=self.force,
             )
 
-            if self._is_cancelled:
+            if self.is_cancelled():
                 self.emit_status("Download cancelled")
                 return
 
@@ -7,6 +7,7 @@ from typing import List, Optional
 import numpy as np
 from app.core.workers.base_worker import BaseWorker
 from app.core.topic_analyzer import TopicAnalyzer
+import config
 
 
 class EmbeddingWorker(BaseWorker):
@@ -22,6 +23,9 @@ class EmbeddingWorker(BaseWorker):
         embedding_model_name: str,
         topic_analyzer: TopicAnalyzer,
         use_cache: bool = True,
+        batch_size: Optional[int] = None,
+        device: Optional[str] = None,
+        embedding_dtype: str = config.DEFAULT_EMBEDDING_CACHE_DTYPE,
     ):
         """
         Initialize embedding worker.
@@ -31,6 +35,10 @@ class EmbeddingWorker(BaseWorker):
             embedding_model_name: Name of embedding model
             topic_analyzer: TopicAnalyzer instance
             use_cache: Whether to use embedding cache
+            batch_size: Encode batch size (None: auto from free GPU memory)
+            device: Device to encode on (None: the analyzer's default)
+            embedding_dtype: Cache dtype ('float32', 'float16', 'int8'); with
+                'float16' the emitted array is float16 as well, halving RAM
         """
         super().__init__()
 
@@ -38,6 +46,9 @@ class EmbeddingWorker(BaseWorker):
         self.embedding_model_name = embedding_model_name
         self.topic_analyzer = topic_analyzer
         self.use_cache = use_cache
+        self.batch_size = batch_size
+        self.device = device
+        self.embedding_dtype = embedding_dtype
 
     def run(self):
         """Generate embeddings."""
@@ -45,7 +56,7 @@ class EmbeddingWorker(BaseWorker):
             self.emit_status("Starting embedding generation...")
 
             def progress_callback(pct, msg):
-                if not self._is_cancelled:
+                if not self.is_cancelled():
                     self.emit_progress(pct, msg)
 
             # Generate embeddings
@@ -54,9 +65,17 @@ class EmbeddingWorker(BaseWorker):
                 embedding_model_name=self.embedding_model_name,
                 use_cache=self.use_cache,
                 progress_callback=progress_callback,
+                batch_size=self.batch_size,
+                device=self.device,
+                embedding_dtype=self.embedding_dtype,
+                memmap=self.use_cache,
             )
 
-            if self._is_cancelled:
+            # Hold float16 in memory until training upcasts for UMAP
+            if self.embedding_dtype == "float16":
+                embeddings = embeddings.astype(np.float16, copy=False)
+
+            if self.is_cancelled():
                 self.emit_status("Embedding generation cancelled")
                 return
 
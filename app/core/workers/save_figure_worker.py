@@ -0,0 +1,81 @@
+"""
+BERTopic Pro - Save Figure Worker
+Background worker for exporting Plotly figures.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Tuple, TYPE_CHECKING
+from app.core.workers.base_worker import BaseWorker
+from app.utils.figure_export import write_figure, write_figure_json
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+class SaveFigureWorker(BaseWorker):
+    """
+    Worker thread for exporting figures.
+
+    Static image export runs Kaleido (headless Chromium) and blocks for
+    seconds per figure, so exports run off the UI thread; several figures
+    are exported in parallel worker processes.
+    """
+
+    def __init__(
+        self,
+        figures: List[Tuple["go.Figure", Path, str]],
+        include_plotlyjs: str = "cdn",
+    ):
+        """
+        Initialize save figure worker.
+
+        Args:
+            figures: List of (figure, filepath, format) to export
+            include_plotlyjs: How to include plotly.js in HTML exports
+        """
+        super().__init__()
+
+        self.figures = figures
+        self.include_plotlyjs = include_plotlyjs
+
+    def run(self):
+        """Export figures."""
+        try:
+            total = len(self.figures)
+            self.emit_status(f"Exporting {total} figure(s)...")
+
+            # A single figure isn't worth a process pool start-up
+            if total == 1:
+                fig, filepath, format = self.figures[0]
+                write_figure(fig, filepath, format, self.include_plotlyjs)
+                self.emit_progress(100, f"Saved: {filepath}")
+                self.emit_finished([str(filepath)])
+                return
+
+            saved = []
+            max_workers = min(total, max(1, (os.cpu_count() or 2) // 2))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        write_figure_json, fig.to_json(), str(filepath), format,
+                        self.include_plotlyjs,
+                    )
+                    for fig, filepath, format in self.figures
+                ]
+
+                for future in as_completed(futures):
+                    if self.is_cancelled():
+                        for pending in futures:
+                            pending.cancel()
+                        self.emit_status("Export cancelled")
+                        return
+
+                    saved.append(future.result())
+                    self.emit_progress(int(len(saved) / total * 100), f"Saved {len(saved)}/{total}")
+
+            self.emit_finished(saved)
+
+        except Exception as e:
+            self.emit_error(e)
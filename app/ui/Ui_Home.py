@@ -51,6 +51,10 @@ class Ui_Home(object):
         self.logConsole = QPlainTextEdit(self.centralwidget)
         self.logConsole.setObjectName(u"logConsole")
         self.logConsole.setStyleSheet(u"background-color: rgb(0, 0, 0);")
+        self.logConsole.setUndoRedoEnabled(False)
+        self.logConsole.setReadOnly(True)
+        self.logConsole.setMaximumBlockCount(1000)
+        self.logConsole.setCenterOnScroll(True)
 
         self.verticalLayout.addWidget(self.logConsole)
 
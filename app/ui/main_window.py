@@ -3,30 +3,37 @@ BERTopic Pro - Main Window
 Main application window with tabbed interface and console.
 """
 
-from typing import Optional
-from PySide6.QtWidgets import (
-    QMainWindow,
-    QWidget,
-    QVBoxLayout,
-    QTabWidget,
-    QPlainTextEdit,
-    QSplitter,
-    QMenuBar,
-    QMenu,
-    QStatusBar,
-)
-from PySide6.QtCore import Qt, QSize,Slot,QObject
-from PySide6.QtGui import QAction, QIcon
+import logging
+from typing import Optional, List
+from PySide6.QtWidgets import QMainWindow, QWidget, QMenu
+from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtGui import QAction
 
 from app.ui.tabs.preprocess_tab import PreprocessTab
-from app.ui.tabs.modeling_tab import ModelingTab
-from app.ui.tabs.visualization_tab import VisualizationTab
-from app.ui.tabs.settings_tab import SettingsTab
-from app.utils.logger import get_logger, setup_logging
+from app.ui.tabs.base_tab import BaseTab
+from app.utils.logger import get_logger, setup_logging, shutdown_logging
 from app.utils.config_manager import get_config_manager
 import config
 from app.ui.Ui_Home import Ui_Home
 
+
+# Tabs after the first are imported and built on first use; their modules
+# pull in torch, BERTopic and QtWebEngine
+def _create_modeling_tab() -> BaseTab:
+    from app.ui.tabs.modeling_tab import ModelingTab
+    return ModelingTab()
+
+
+def _create_visualization_tab() -> BaseTab:
+    from app.ui.tabs.visualization_tab import VisualizationTab
+    return VisualizationTab()
+
+
+def _create_settings_tab() -> BaseTab:
+    from app.ui.tabs.settings_tab import SettingsTab
+    return SettingsTab()
+
+
 class MainWindow(QMainWindow, Ui_Home):
     """
     Main application window.
@@ -38,6 +45,15 @@ class MainWindow(QMainWindow, Ui_Home):
     - Status bar
     """
 
+    # About dialog body; every value in it is fixed at startup
+    _ABOUT_HTML = f"""
+            <h3>{config.APP_NAME}</h3>
+            <p>版本: {config.APP_VERSION}</p>
+            <p>专业的主题建模分析平台</p>
+            <p>基于 BERTopic 和 PySide6 构建</p>
+            <p>设备: {config.DEFAULT_DEVICE.upper()}</p>
+            """
+
     def __init__(self):
         """Initialize the main window."""
         super().__init__()
@@ -54,11 +70,12 @@ class MainWindow(QMainWindow, Ui_Home):
 
         # Set up logging (now that console exists)
         self.qt_logger = setup_logging(self.logConsole)
+        self.actionShow_Console.toggled.connect(self.qt_logger.set_console_visible)
 
         # Restore window geometry
         self.restore_geometry()
 
-        self.logger.info(f"{config.APP_NAME} v{config.APP_VERSION} started")
+        self.logger.info("%s v%s started", config.APP_NAME, config.APP_VERSION)
 
     def _setup_ui(self):
         """Set up the main window UI."""
@@ -67,35 +84,38 @@ class MainWindow(QMainWindow, Ui_Home):
         self.setMinimumSize(config.WINDOW_MIN_WIDTH, config.WINDOW_MIN_HEIGHT)
         self.resize(config.WINDOW_DEFAULT_WIDTH, config.WINDOW_DEFAULT_HEIGHT)
 
-        # Create tabs
+        # Create tabs; all but the first start as placeholders
         self.preprocess_tab = PreprocessTab()
-        self.modeling_tab = ModelingTab()
-        self.visualization_tab = VisualizationTab()
-        self.settings_tab = SettingsTab()
-
-        # Add tabs to tab widget
+        self.modeling_tab: Optional[BaseTab] = None
+        self.visualization_tab: Optional[BaseTab] = None
+        self.settings_tab: Optional[BaseTab] = None
+        self._materialized_tabs: List[BaseTab] = [self.preprocess_tab]
+
+        # index -> (attribute name, title, factory)
+        self._tab_factories = {
+            1: ('modeling_tab', "2. BERTopic 建模", _create_modeling_tab),
+            2: ('visualization_tab', "3. 可视化生成", _create_visualization_tab),
+            3: ('settings_tab', "4. 系统设置", _create_settings_tab),
+        }
+
+        # Add tabs to tab widget; one relayout/repaint for the whole batch
+        self.tabWidget.setUpdatesEnabled(False)
+        self.tabWidget.blockSignals(True)
         self.tabWidget.addTab(self.preprocess_tab, "1. 数据预处理")
-        self.tabWidget.addTab(self.modeling_tab, "2. BERTopic 建模")
-        self.tabWidget.addTab(self.visualization_tab, "3. 可视化生成")
-        self.tabWidget.addTab(self.settings_tab, "4. 系统设置")
+        for index in sorted(self._tab_factories):
+            self.tabWidget.addTab(QWidget(), self._tab_factories[index][1])
 
         # Initially disable tabs 2 and 3 (until data is loaded and model trained)
         self.tabWidget.setTabEnabled(1, False)  # Modeling tab
         self.tabWidget.setTabEnabled(2, False)  # Visualization tab
+        self.tabWidget.blockSignals(False)
+        self.tabWidget.setUpdatesEnabled(True)
+        self.tabWidget.currentChanged.connect(self._materialize_tab)
 
-        # Create console
-        self.logConsole.setReadOnly(True)
+        # Create console (read-only, undo disabled and capped in Ui_Home)
         self.logConsole.setMaximumBlockCount(config.CONSOLE_LOG_MAX_LINES)
         self.logConsole.setPlaceholderText("应用日志将显示在这里...")
 
-        # self.verticalLayout.removeWidget(self.tabWidget)
-        # self.verticalLayout.removeWidget(self.logConsole)
-        # self.splitter = QSplitter(Qt.Vertical)
-        # self.splitter.addWidget(self.tabWidget)
-        # self.splitter.addWidget(self.logConsole)
-        # self.splitter.setSizes([700, 300])
-        # self.verticalLayout.addWidget(self.splitter)
-
         # Create menu bar
         self.menu_bar_bind()
 
@@ -111,8 +131,8 @@ class MainWindow(QMainWindow, Ui_Home):
         self.actionOpen.setShortcut("Ctrl+O")
         self.actionOpen.triggered.connect(self.on_open_file)
 
-        # Recent files submenu
-        self.update_recent_files_menu(self.menuRecent)
+        # Recent files submenu, filled in when it is opened
+        self.menuRecent.aboutToShow.connect(self._on_recent_menu_about_to_show)
 
         # Exit action
         self.actionQuit.setShortcut("Ctrl+Q")
@@ -125,28 +145,87 @@ class MainWindow(QMainWindow, Ui_Home):
         """Create the status bar."""
         self.statusbar.showMessage("就绪")
 
+        # Tab status bursts are coalesced; only the latest message is shown
+        self._pending_status: Optional[str] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._show_pending_status)
+
+    def _show_status(self, message: str, timeout: int):
+        """Show a status bar message unless it is already displayed."""
+        if message == self.statusbar.currentMessage():
+            return
+        self.statusbar.showMessage(message, timeout)
+
+    @Slot()
+    def _show_pending_status(self):
+        """Show the latest status message queued by on_status_change."""
+        if self._pending_status is not None:
+            self._show_status(self._pending_status, 3000)
+            self._pending_status = None
+
     def connect_tab_signals(self):
         """Connect signals between tabs."""
         # When data is loaded in preprocess tab, enable modeling tab
-        self.preprocess_tab.data_loaded.connect(self.on_data_loaded)
+        self.preprocess_tab.data_loaded.connect(self.on_data_loaded, Qt.DirectConnection)
+        self._connect_common_signals(self.preprocess_tab)
+
+    def _connect_common_signals(self, tab: BaseTab):
+        """
+        Connect a tab's error and status signals to the status bar.
 
-        # When model is trained in modeling tab, enable visualization tab
-        self.modeling_tab.model_trained.connect(self.on_model_trained)
+        Tabs emit these from their own slots on the GUI thread, so the
+        connections are direct calls. Each tab is connected exactly once:
+        preprocess at startup, the others when their factory is consumed.
+        """
+        tab.error_occurred.connect(self.on_error, Qt.DirectConnection)
+        tab.status_changed.connect(self.on_status_change, Qt.DirectConnection)
+
+    def _materialize_tab(self, index: int) -> Optional[BaseTab]:
+        """
+        Build the real tab at index if it is still a placeholder.
+
+        Args:
+            index: Tab index
 
-        # Connect error signals to status bar
-        for tab in [
-            self.preprocess_tab,
-            self.modeling_tab,
-            self.visualization_tab,
-            self.settings_tab,
-        ]:
-            tab.error_occurred.connect(self.on_error)
-            tab.status_changed.connect(self.on_status_change)
+        Returns:
+            The tab widget at index
+        """
+        if index not in self._tab_factories:
+            return self.tabWidget.widget(index)
+
+        attr, title, factory = self._tab_factories.pop(index)
+        tab = factory()
+        setattr(self, attr, tab)
+        self._materialized_tabs.append(tab)
+
+        # Swap without re-entering currentChanged
+        was_current = self.tabWidget.currentIndex() == index
+        enabled = self.tabWidget.isTabEnabled(index)
+        placeholder = self.tabWidget.widget(index)
+        self.tabWidget.blockSignals(True)
+        self.tabWidget.removeTab(index)
+        self.tabWidget.insertTab(index, tab, title)
+        self.tabWidget.setTabEnabled(index, enabled)
+        if was_current:
+            self.tabWidget.setCurrentIndex(index)
+        self.tabWidget.blockSignals(False)
+        placeholder.deleteLater()
+
+        self._connect_common_signals(tab)
+        if attr == 'modeling_tab':
+            # When model is trained in modeling tab, enable visualization tab
+            tab.model_trained.connect(self.on_model_trained, Qt.DirectConnection)
+
+        self.logger.debug("Created tab: %s", title)
+        return tab
 
     # ========================================================================
     # Slot Methods
     # ========================================================================
 
+    @Slot()
     def on_open_file(self):
         """Handle open file action."""
         self.logger.info("Open file dialog triggered")
@@ -154,7 +233,7 @@ class MainWindow(QMainWindow, Ui_Home):
         self.tabWidget.setCurrentIndex(0)
         self.statusbar.showMessage("请在数据预处理标签中选择文件", 3000)
     
-    @Slot(QObject)
+    @Slot(object)
     def on_data_loaded(self, data):
         """
         Handle data loaded signal.
@@ -163,15 +242,20 @@ class MainWindow(QMainWindow, Ui_Home):
             data: Loaded data object (pandas DataFrame)
         """
         self.logger.info("Data loaded, enabling modeling tab")
+        if self.logger.isEnabledFor(logging.DEBUG) and hasattr(data, 'columns'):
+            self.logger.debug(
+                "Loaded data: %d rows, columns: %s", len(data), ", ".join(map(str, data.columns))
+            )
         self.tabWidget.setTabEnabled(1, True)
 
         # Pass processed data to modeling tab if it has processed text
         if hasattr(data, 'columns') and 'text_processed' in data.columns:
-            self.modeling_tab.set_processed_data(data)
+            self._materialize_tab(1).set_processed_data(data)
             self.statusbar.showMessage("处理后的数据已传递到建模模块", 3000)
         else:
             self.statusbar.showMessage("数据加载完成，建模功能已启用", 3000)
 
+    @Slot(object)
     def on_model_trained(self, model):
         """
         Handle model trained signal.
@@ -185,11 +269,12 @@ class MainWindow(QMainWindow, Ui_Home):
         # Pass topic analyzer to visualization tab
         if isinstance(model, dict) and 'topic_analyzer' in model:
             topic_analyzer = model['topic_analyzer']
-            self.visualization_tab.set_topic_analyzer(topic_analyzer)
+            self._materialize_tab(2).set_topic_analyzer(topic_analyzer)
             self.statusbar.showMessage("模型训练完成，可视化功能已启用", 3000)
         else:
             self.statusbar.showMessage("模型训练完成", 3000)
 
+    @Slot(str)
     def on_error(self, error_message: str):
         """
         Handle error signal.
@@ -197,8 +282,12 @@ class MainWindow(QMainWindow, Ui_Home):
         Args:
             error_message: Error message
         """
-        self.statusbar.showMessage(f"错误: {error_message}", 5000)
-    
+        # Errors are shown immediately and replace any queued status
+        self._status_timer.stop()
+        self._pending_status = None
+        self._show_status(f"错误: {error_message}", 5000)
+
+    @Slot(str)
     def on_status_change(self, status_message: str):
         """
         Handle status change signal.
@@ -206,33 +295,68 @@ class MainWindow(QMainWindow, Ui_Home):
         Args:
             status_message: Status message
         """
-        self.statusbar.showMessage(status_message, 3000)
-
+        self._pending_status = status_message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
 
     def update_recent_files_menu(self, menu: QMenu):
         """
         Update recent files menu.
 
+        Existing actions are reused and only the difference to the current
+        list is inserted or removed.
+
         Args:
             menu: Recent files menu
         """
-        menu.clear()
+        if not hasattr(self, '_recent_actions'):
+            # Fixed entries, created once
+            self._recent_actions: List[QAction] = []
+            self._no_recent_action = QAction("(无最近文件)", self)
+            self._no_recent_action.setEnabled(False)
+            menu.addAction(self._no_recent_action)
+            self._recent_separator = menu.addSeparator()
+            self._clear_recent_action = QAction("清空列表", self)
+            self._clear_recent_action.triggered.connect(self.clear_recent_files)
+            menu.addAction(self._clear_recent_action)
+
         recent_files = self.config_manager.get_recent_files()
 
-        if not recent_files:
-            no_files_action = QAction("(无最近文件)", self)
-            no_files_action.setEnabled(False)
-            menu.addAction(no_files_action)
-        else:
-            for file_path in recent_files:
+        # Drop surplus actions, then retarget or add the rest in order
+        for action in self._recent_actions[len(recent_files):]:
+            menu.removeAction(action)
+            action.deleteLater()
+        del self._recent_actions[len(recent_files):]
+
+        for i, file_path in enumerate(recent_files):
+            if i < len(self._recent_actions):
+                action = self._recent_actions[i]
+                if action.data() != file_path:
+                    action.setText(file_path)
+                    action.setData(file_path)
+            else:
                 action = QAction(file_path, self)
-                action.triggered.connect(lambda checked, f=file_path: self.open_recent_file(f))
-                menu.addAction(action)
+                action.setData(file_path)
+                action.triggered.connect(self._on_recent_triggered)
+                menu.insertAction(self._recent_separator, action)
+                self._recent_actions.append(action)
+
+        has_files = bool(recent_files)
+        self._no_recent_action.setVisible(not has_files)
+        self._recent_separator.setVisible(has_files)
+        self._clear_recent_action.setVisible(has_files)
+
+    @Slot()
+    def _on_recent_menu_about_to_show(self):
+        """Refresh the recent files menu just before it is shown."""
+        self.update_recent_files_menu(self.menuRecent)
 
-            menu.addSeparator()
-            clear_action = QAction("清空列表", self)
-            clear_action.triggered.connect(self.clear_recent_files)
-            menu.addAction(clear_action)
+    @Slot()
+    def _on_recent_triggered(self):
+        """Open the recent file stored in the triggering action's data."""
+        action = self.sender()
+        if isinstance(action, QAction):
+            self.open_recent_file(action.data())
 
     def open_recent_file(self, file_path: str):
         """
@@ -241,30 +365,22 @@ class MainWindow(QMainWindow, Ui_Home):
         Args:
             file_path: Path to the file
         """
-        self.logger.info(f"Opening recent file: {file_path}")
+        self.logger.info("Opening recent file: %s", file_path)
         # TODO: Implement file opening logic
-        self.statusBar().showMessage(f"正在打开: {file_path}", 3000)
+        self.statusbar.showMessage(f"正在打开: {file_path}", 3000)
 
+    @Slot()
     def clear_recent_files(self):
         """Clear recent files list."""
         self.config_manager.clear_recent_files()
         self.logger.info("Recent files cleared")
 
+    @Slot()
     def show_about(self):
         """Show about dialog."""
         from PySide6.QtWidgets import QMessageBox
 
-        QMessageBox.about(
-            self,
-            "关于 BERTopic Pro",
-            f"""
-            <h3>{config.APP_NAME}</h3>
-            <p>版本: {config.APP_VERSION}</p>
-            <p>专业的主题建模分析平台</p>
-            <p>基于 BERTopic 和 PySide6 构建</p>
-            <p>设备: {config.DEFAULT_DEVICE.upper()}</p>
-            """,
-        )
+        QMessageBox.about(self, "关于 BERTopic Pro", self._ABOUT_HTML)
 
     # ========================================================================
     # Window State Management
@@ -292,14 +408,11 @@ class MainWindow(QMainWindow, Ui_Home):
         # Save window geometry
         self.save_geometry()
 
-        # Cleanup tabs
-        for tab in [
-            self.preprocess_tab,
-            self.modeling_tab,
-            self.visualization_tab,
-            self.settings_tab,
-        ]:
-            if tab:
-                tab.cleanup()
+        # Cleanup tabs that were actually built; placeholders have nothing to release
+        for tab in self._materialized_tabs:
+            tab.cleanup()
+
+        # Flush queued log records and stop the listener thread
+        shutdown_logging()
 
         event.accept()
@@ -67,6 +67,40 @@ class Ui_Modeling(object):
 
         self.verticalLayout_2.addLayout(self.horizontalLayout_5)
 
+        self.horizontalLayout_6 = QHBoxLayout()
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.label_13 = QLabel(self.groupBox)
+        self.label_13.setObjectName(u"label_13")
+
+        self.horizontalLayout_6.addWidget(self.label_13)
+
+        self.embed_batch_spin = QSpinBox(self.groupBox)
+        self.embed_batch_spin.setObjectName(u"embed_batch_spin")
+
+        self.horizontalLayout_6.addWidget(self.embed_batch_spin)
+
+        self.horizontalLayout_6.setStretch(0, 2)
+        self.horizontalLayout_6.setStretch(1, 8)
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_6)
+
+        self.horizontalLayout_7 = QHBoxLayout()
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.label_14 = QLabel(self.groupBox)
+        self.label_14.setObjectName(u"label_14")
+
+        self.horizontalLayout_7.addWidget(self.label_14)
+
+        self.embed_dtype_combo = QComboBox(self.groupBox)
+        self.embed_dtype_combo.setObjectName(u"embed_dtype_combo")
+
+        self.horizontalLayout_7.addWidget(self.embed_dtype_combo)
+
+        self.horizontalLayout_7.setStretch(0, 2)
+        self.horizontalLayout_7.setStretch(1, 8)
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_7)
+
 
         self.horizontalLayout.addWidget(self.groupBox)
 
@@ -243,6 +277,11 @@ class Ui_Modeling(object):
 
         self.horizontalLayout_3.addWidget(self.calc_probs_cb)
 
+        self.use_gpu_cb = QCheckBox(self.groupBox_2)
+        self.use_gpu_cb.setObjectName(u"use_gpu_cb")
+
+        self.horizontalLayout_3.addWidget(self.use_gpu_cb)
+
 
         self.verticalLayout_6.addWidget(self.groupBox_2)
 
@@ -257,6 +296,14 @@ class Ui_Modeling(object):
         self.groupBox.setTitle(QCoreApplication.translate("Modeling", u"\u5d4c\u5165\u6a21\u578b", None))
         self.label.setText(QCoreApplication.translate("Modeling", u"\u9009\u62e9\u6a21\u578b", None))
         self.label_2.setText(QCoreApplication.translate("Modeling", u"\u9009\u62e9\u8bed\u8a00", None))
+        self.label_13.setText(QCoreApplication.translate("Modeling", u"\u7f16\u7801\u6279\u5927\u5c0f", None))
+#if QT_CONFIG(tooltip)
+        self.embed_batch_spin.setToolTip(QCoreApplication.translate("Modeling", u"\u6bcf\u6b21\u524d\u5411\u8ba1\u7b97\u7684\u53e5\u5b50\u6570\uff0c\u8bbe\u4e3a 0 \u8868\u793a\u6309\u663e\u5b58\u81ea\u52a8\u786e\u5b9a", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_14.setText(QCoreApplication.translate("Modeling", u"\u5d4c\u5165\u7cbe\u5ea6", None))
+#if QT_CONFIG(tooltip)
+        self.embed_dtype_combo.setToolTip(QCoreApplication.translate("Modeling", u"\u5d4c\u5165\u7f13\u5b58\u4e0e\u8bad\u7ec3\u540e\u4fdd\u7559\u7684\u7cbe\u5ea6\uff0cfloat16 \u5360\u7528\u4e00\u534a\u5185\u5b58\u548c\u78c1\u76d8", None))
+#endif // QT_CONFIG(tooltip)
         self.groupBox_5.setTitle(QCoreApplication.translate("Modeling", u"\u64cd\u4f5c", None))
         self.train_btn.setText(QCoreApplication.translate("Modeling", u"\u5f00\u59cb\u8bad\u7ec3", None))
         self.save_model_btn.setText(QCoreApplication.translate("Modeling", u"\u4fdd\u5b58\u6a21\u578b", None))
@@ -296,5 +343,9 @@ class Ui_Modeling(object):
         self.calc_probs_cb.setToolTip(QCoreApplication.translate("Modeling", u"\u8ba1\u7b97\u6587\u6863\u7684\u4e3b\u9898\u6982\u7387\u5206\u5e03\uff08\u8f83\u6162\uff09", None))
 #endif // QT_CONFIG(tooltip)
         self.calc_probs_cb.setText(QCoreApplication.translate("Modeling", u"\u8ba1\u7b97\u4e3b\u9898\u6982\u7387", None))
+#if QT_CONFIG(tooltip)
+        self.use_gpu_cb.setToolTip(QCoreApplication.translate("Modeling", u"\u4f7f\u7528 RAPIDS cuML \u5728 GPU \u4e0a\u8fd0\u884c UMAP \u548c HDBSCAN\uff08\u9700\u5b89\u88c5 cuml\uff09", None))
+#endif // QT_CONFIG(tooltip)
+        self.use_gpu_cb.setText(QCoreApplication.translate("Modeling", u"\u4f7f\u7528 GPU (cuML)", None))
     # retranslateUi
 
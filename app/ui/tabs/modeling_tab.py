@@ -4,7 +4,7 @@ Tab 2: BERTopic model training with parameter configuration.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List
 import pandas as pd
 import numpy as np
 
@@ -19,7 +19,7 @@ from PySide6.QtCore import Qt, Signal, QThread
 
 from app.ui.tabs.base_tab import BaseTab
 from app.core.model_manager import ModelManager
-from app.core.topic_analyzer import TopicAnalyzer, TopicModelParams
+from app.core.topic_analyzer import TopicAnalyzer, TopicModelParams, CUML_AVAILABLE
 from app.core.workers.bertopic_worker import BertopicWorker
 from app.core.workers.download_worker import DownloadWorker
 import config
@@ -28,6 +28,9 @@ from app.ui.tabs.Ui_Modeling import Ui_Modeling
 class ModelingTab(BaseTab, Ui_Modeling):
     """Tab for BERTopic model training."""
 
+    # Starts the current worker on the persistent worker thread
+    _run_worker = Signal()
+
     def setup_ui(self):
         """Set up the UI for this tab."""
         self.setupUi(self)
@@ -41,11 +44,18 @@ class ModelingTab(BaseTab, Ui_Modeling):
         self.bind()
         # State variables
         self.processed_data: Optional[pd.DataFrame] = None
+        self._documents: Optional[List[str]] = None  # processed_data['text_processed'] as a list
         self.model_manager = ModelManager()
         self.topic_analyzer: Optional[TopicAnalyzer] = None
-        self.worker_thread: Optional[QThread] = None
+        self.worker_thread: Optional[QThread] = None  # long-lived, started on first use
         self.worker = None
 
+        # Embeddings of processed_data from the last training run, reused
+        # while only UMAP/HDBSCAN/c-TF-IDF settings change
+        self._embeddings: Optional[np.ndarray] = None
+        self._embeddings_key: Optional[tuple] = None
+        self._pending_embeddings_key: Optional[tuple] = None
+
         # Connect to preprocessing tab
         self._setup_connections()
 
@@ -62,6 +72,14 @@ class ModelingTab(BaseTab, Ui_Modeling):
         ]
         self.model_combo.addItems(recommended_models)
 
+        # Encode batch size (0: auto from free GPU memory)
+        self.embed_batch_spin.setRange(0, config.EMBEDDING_MAX_BATCH_SIZE)
+        self.embed_batch_spin.setValue(0)
+        self.embed_batch_spin.setSpecialValueText("自动")
+
+        # Embedding precision: cache dtype, also what is retained after training
+        self.embed_dtype_combo.addItems(['float32', 'float16'])
+        self.embed_dtype_combo.setCurrentText(config.DEFAULT_EMBEDDING_CACHE_DTYPE)
 
         self.umap_n_neighbors_spin.setRange(2, 200)
         self.umap_n_neighbors_spin.setValue(config.DEFAULT_UMAP_N_NEIGHBORS)
@@ -104,6 +122,11 @@ class ModelingTab(BaseTab, Ui_Modeling):
         self.nr_topics_spin.setValue(0)
         self.nr_topics_spin.setSpecialValueText("自动")
 
+        # GPU UMAP/HDBSCAN only when cuML is installed and CUDA is usable
+        gpu_available = CUML_AVAILABLE and config.DEFAULT_USE_GPU
+        self.use_gpu_cb.setEnabled(gpu_available)
+        self.use_gpu_cb.setChecked(gpu_available)
+
     def _setup_connections(self):
         """Set up connections to other tabs."""
         # This will be called when data is loaded from preprocessing tab
@@ -123,19 +146,14 @@ class ModelingTab(BaseTab, Ui_Modeling):
             QMessageBox.information(self, "提示", "这是本地模型，无需下载")
             return
 
-        # Start download worker
-        self.worker = DownloadWorker(model_name, self.model_manager)
-        self.worker_thread = QThread()
-        self.worker.moveToThread(self.worker_thread)
-
-        # Connect signals
-        self.worker.progress.connect(self.update_progress)
-        self.worker.status.connect(self.on_status_change)
-        self.worker.finished.connect(self.on_download_finished)
-        self.worker.error.connect(self.on_download_error)
+        # Already downloaded: no worker thread or Hub round-trip needed
+        model_path = self.model_manager.get_model_path(model_name)
+        if model_path is not None:
+            self.on_download_finished({'model_name': model_name, 'model_path': model_path})
+            return
 
-        self.worker_thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.worker_thread.quit)
+        # Start download worker
+        worker = DownloadWorker(model_name, self.model_manager)
 
         # Update UI
         self.download_btn.setEnabled(False)
@@ -143,7 +161,7 @@ class ModelingTab(BaseTab, Ui_Modeling):
         self.progress_bar.setValue(0)
 
         # Start
-        self.worker_thread.start()
+        self._start_worker(worker, self.on_download_finished, self.on_download_error)
         self.logger.info(f"Downloading model: {model_name}")
 
     def on_download_finished(self, result):
@@ -173,7 +191,11 @@ class ModelingTab(BaseTab, Ui_Modeling):
         Args:
             df: DataFrame with processed text
         """
+        if df is not self.processed_data:
+            self._documents = None
         self.processed_data = df
+        self._embeddings = None
+        self._embeddings_key = None
         self.train_btn.setEnabled(True)
         self.logger.info(f"Received processed data: {len(df)} documents")
 
@@ -188,8 +210,10 @@ class ModelingTab(BaseTab, Ui_Modeling):
             QMessageBox.warning(self, "错误", "未找到处理后的文本列 'text_processed'")
             return
 
-        # Get documents
-        documents = self.processed_data['text_processed'].tolist()
+        # Get documents (materialized once per processed DataFrame)
+        if self._documents is None:
+            self._documents = self.processed_data['text_processed'].astype(str).tolist()
+        documents = self._documents
 
         if not documents:
             QMessageBox.warning(self, "错误", "没有可用的文档进行训练")
@@ -205,6 +229,8 @@ class ModelingTab(BaseTab, Ui_Modeling):
         # Collect parameters
         params = TopicModelParams(
             embedding_model=embedding_model,
+            embedding_dtype=self.embed_dtype_combo.currentText(),
+            embedding_batch_size=self.embed_batch_spin.value() or None,
             umap_n_neighbors=self.umap_n_neighbors_spin.value(),
             umap_n_components=self.umap_n_components_spin.value(),
             umap_min_dist=self.umap_min_dist_spin.value(),
@@ -218,26 +244,29 @@ class ModelingTab(BaseTab, Ui_Modeling):
             calculate_probabilities=self.calc_probs_cb.isChecked(),
         )
 
-        # Create topic analyzer
+        # A fresh analyzer per run: the visualization tab keeps using the
+        # previous one until model_trained hands over this one. It is cheap;
+        # the embedding model stays in ModelManager's loaded-model cache.
         self.topic_analyzer = TopicAnalyzer(model_manager=self.model_manager)
 
+        # Documents only change through set_processed_data(), which drops the
+        # cached embeddings, so the key covers just the encoding settings
+        embeddings_key = (
+            params.embedding_model, params.embedding_dtype, params.umap_metric == 'cosine'
+        )
+        embeddings = self._embeddings if embeddings_key == self._embeddings_key else None
+        self._pending_embeddings_key = embeddings_key
+        if embeddings is not None:
+            self.logger.info("Reusing embeddings from the previous training run")
+
         # Start training worker
-        self.worker = BertopicWorker(
+        worker = BertopicWorker(
             documents=documents,
             topic_analyzer=self.topic_analyzer,
             params=params,
+            embeddings=embeddings,
+            use_gpu=self.use_gpu_cb.isChecked(),
         )
-        self.worker_thread = QThread()
-        self.worker.moveToThread(self.worker_thread)
-
-        # Connect signals
-        self.worker.progress.connect(self.update_progress)
-        self.worker.status.connect(self.on_status_change)
-        self.worker.finished.connect(self.on_training_finished)
-        self.worker.error.connect(self.on_training_error)
-
-        self.worker_thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.worker_thread.quit)
 
         # Update UI
         self.train_btn.setEnabled(False)
@@ -247,9 +276,40 @@ class ModelingTab(BaseTab, Ui_Modeling):
         self.results_text.append("训练开始...\n")
 
         # Start
-        self.worker_thread.start()
+        self._start_worker(worker, self.on_training_finished, self.on_training_error)
         self.logger.info("BERTopic training started")
 
+    def _start_worker(self, worker, on_finished, on_error):
+        """
+        Run a worker on the tab's persistent worker thread.
+
+        The thread is created once and reused across downloads and training
+        runs; each worker is deleted once it finishes or fails.
+
+        Args:
+            worker: BaseWorker to run
+            on_finished: Slot for the worker's finished signal
+            on_error: Slot for the worker's error signal
+        """
+        if self.worker_thread is None:
+            self.worker_thread = QThread(self)
+            self.worker_thread.start()
+
+        self.worker = worker
+        worker.moveToThread(self.worker_thread)
+
+        # Connect signals
+        worker.progress.connect(self.update_progress)
+        worker.status.connect(self.on_status_change)
+        worker.finished.connect(on_finished)
+        worker.error.connect(on_error)
+        worker.finished.connect(worker.deleteLater)
+        worker.error.connect(worker.deleteLater)
+
+        # Queued to the worker thread; the connection drops after one run
+        self._run_worker.connect(worker.run, Qt.SingleShotConnection)
+        self._run_worker.emit()
+
     def update_progress(self, value: int):
         """Update progress bar."""
         self.progress_bar.setValue(value)
@@ -264,26 +324,32 @@ class ModelingTab(BaseTab, Ui_Modeling):
         topics = result['topics']
         topic_analyzer = result['topic_analyzer']
 
+        # Keep embeddings for the next run on the same data
+        self._embeddings = topic_analyzer.embeddings
+        self._embeddings_key = self._pending_embeddings_key
+
         # Display results
         topic_info = topic_analyzer.get_topic_info()
 
         if topic_info is not None:
-            num_topics = len(topic_info) - 1  # Exclude outlier topic (-1)
+            num_topics = int((topic_info['Topic'] != -1).sum())  # Exclude outlier topic (-1)
 
-            self.results_text.append(f"\n训练完成！\n")
-            self.results_text.append(f"发现主题数: {num_topics}\n")
-            self.results_text.append(f"总文档数: {len(topics)}\n")
-            self.results_text.append(f"\n主题信息:\n")
-            self.results_text.append("=" * 60 + "\n")
+            lines = [
+                f"\n训练完成！\n",
+                f"发现主题数: {num_topics}\n",
+                f"总文档数: {len(topics)}\n",
+                f"\n主题信息:\n",
+                "=" * 60 + "\n",
+            ]
 
             # Show top topics
-            for idx, row in topic_info.head(10).iterrows():
-                topic_id = row['Topic']
-                count = row['Count']
-                words = row['Name']
+            top_topics = topic_info.head(10)[['Topic', 'Count', 'Name']]
+            for topic_id, count, words in top_topics.itertuples(index=False):
+                lines.append(f"\n主题 {topic_id}: ({count} 文档)\n")
+                lines.append(f"  {words}\n")
 
-                self.results_text.append(f"\n主题 {topic_id}: ({count} 文档)\n")
-                self.results_text.append(f"  {words}\n")
+            # One append (one relayout) for the whole report
+            self.results_text.append("\n".join(lines))
 
         # Emit signal
         self.model_trained.emit(result)
@@ -343,7 +409,7 @@ class ModelingTab(BaseTab, Ui_Modeling):
                 topic_info = self.topic_analyzer.get_topic_info()
 
                 if topic_info is not None:
-                    num_topics = len(topic_info) - 1
+                    num_topics = int((topic_info['Topic'] != -1).sum())
 
                     self.results_text.clear()
                     self.results_text.append(f"模型加载成功！\n")
@@ -357,3 +423,15 @@ class ModelingTab(BaseTab, Ui_Modeling):
             except Exception as e:
                 QMessageBox.critical(self, "加载失败", f"无法加载模型:\n{str(e)}")
                 self.error_occurred.emit(str(e))
+
+    def cleanup(self):
+        """Cancel any running worker and stop the worker thread."""
+        if self.worker_thread is not None:
+            try:
+                if self.worker is not None:
+                    self.worker.cancel()
+            except RuntimeError:
+                pass  # worker already deleted
+            self.worker_thread.quit()
+            self.worker_thread.wait()
+        super().cleanup()
@@ -38,7 +38,7 @@ class ProcessingWorker(BaseWorker):
         """Process texts in background."""
         try:
             def progress_callback(pct, msg):
-                if not self._is_cancelled:
+                if not self.is_cancelled():
                     self.emit_progress(pct, msg)
 
             # Process dataframe
@@ -246,7 +246,8 @@ class PreprocessTab(BaseTab, Ui_Preprocess):
 
         self.processor = TextProcessor(
             stopwords_path=stopwords_path,
-            custom_dict_path=custom_dict_path
+            custom_dict_path=custom_dict_path,
+            enable_parallel=config.JIEBA_PARALLEL_MODE,
         )
 
         # Get processing options
@@ -4,7 +4,7 @@ Tab 3: Interactive visualization generation with Plotly and QWebEngineView.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 import tempfile
 
 from PySide6.QtWidgets import (
@@ -12,18 +12,22 @@ from PySide6.QtWidgets import (
     QListWidget, QListWidgetItem, QMessageBox,
     QSplitter, QWidget, QComboBox,
 )
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt, QUrl, QThread, Signal
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebEngineCore import QWebEngineSettings
 from app.ui.tabs.base_tab import BaseTab
 from app.core.visualization_generator import VisualizationGenerator
 from app.core.topic_analyzer import TopicAnalyzer
+from app.core.workers.save_figure_worker import SaveFigureWorker
 import config
 
 
 class VisualizationTab(BaseTab):
     """Tab for BERTopic visualization."""
 
+    # Starts the current export worker on the persistent export thread
+    _run_export = Signal()
+
     def setup_ui(self):
         """Set up the UI for this tab."""
         main_layout = QVBoxLayout(self)
@@ -83,6 +87,9 @@ class VisualizationTab(BaseTab):
         self.viz_generator: Optional[VisualizationGenerator] = None
         self.current_figure = None
         self.current_viz_id: Optional[str] = None
+        self.figure_cache: Dict[str, object] = {}  # viz id -> figure for the current model
+        self.export_thread: Optional[QThread] = None  # long-lived, started on first export
+        self.export_worker: Optional[SaveFigureWorker] = None
 
     def create_visualization_selector(self) -> QGroupBox:
         """Create visualization type selector."""
@@ -107,6 +114,12 @@ class VisualizationTab(BaseTab):
         self.generate_btn.clicked.connect(self.generate_visualization)
         layout.addWidget(self.generate_btn)
 
+        # Generate every visualization at once (shared inputs computed once)
+        self.generate_all_btn = QPushButton("生成全部可视化")
+        self.generate_all_btn.setEnabled(False)
+        self.generate_all_btn.clicked.connect(self.generate_all_visualizations)
+        layout.addWidget(self.generate_all_btn)
+
         group.setLayout(layout)
         return group
 
@@ -142,12 +155,14 @@ class VisualizationTab(BaseTab):
 
             # Create visualization generator
             self.viz_generator = VisualizationGenerator(topic_analyzer)
+            self.figure_cache.clear()
 
             # Populate visualization list
             self.populate_visualization_list()
 
             # Enable controls
             self.generate_btn.setEnabled(True)
+            self.generate_all_btn.setEnabled(True)
 
             # Update info
             self.info_label.setText("请选择可视化类型")
@@ -199,7 +214,10 @@ class VisualizationTab(BaseTab):
             self.generate_btn.setEnabled(False)
 
             # Generate figure based on type
-            if self.current_viz_id == "topics":
+            if self.current_viz_id in self.figure_cache:
+                fig = self.figure_cache[self.current_viz_id]
+
+            elif self.current_viz_id == "topics":
                 fig = self.viz_generator.visualize_topics()
 
             elif self.current_viz_id == "hierarchy":
@@ -233,6 +251,7 @@ class VisualizationTab(BaseTab):
 
             # Store current figure
             self.current_figure = fig
+            self.figure_cache[self.current_viz_id] = fig
 
             # Display in web view
             self.display_figure(fig)
@@ -251,6 +270,41 @@ class VisualizationTab(BaseTab):
             self.generate_btn.setEnabled(True)
             self.info_label.setText("生成失败，请重试")
 
+    def generate_all_visualizations(self):
+        """Generate every visualization and show the selected (or first) one."""
+        if self.viz_generator is None:
+            QMessageBox.warning(self, "错误", "请先训练模型")
+            return
+
+        try:
+            self.info_label.setText("正在生成全部可视化...")
+            self.generate_btn.setEnabled(False)
+            self.generate_all_btn.setEnabled(False)
+
+            figures = self.viz_generator.generate_all()
+            if not figures:
+                raise ValueError("所有可视化均生成失败，请查看日志")
+            self.figure_cache.update(figures)
+
+            viz_id = self.current_viz_id if self.current_viz_id in figures else next(iter(figures))
+            self.current_viz_id = viz_id
+            self.current_figure = figures[viz_id]
+
+            self.display_figure(self.current_figure)
+            self.export_btn.setEnabled(True)
+
+            self.info_label.setText(f"已生成 {len(figures)} 个可视化")
+            self.logger.info(f"Generated {len(figures)} visualizations, showing: {viz_id}")
+
+        except Exception as e:
+            self.logger.error(f"Failed to generate visualizations: {e}")
+            QMessageBox.critical(self, "生成失败", f"无法生成可视化:\n{str(e)}")
+            self.info_label.setText("生成失败，请重试")
+
+        finally:
+            self.generate_btn.setEnabled(True)
+            self.generate_all_btn.setEnabled(True)
+
     def display_figure(self, fig):
         """
         Display Plotly figure in web view.
@@ -323,29 +377,50 @@ class VisualizationTab(BaseTab):
         )
 
         if filepath:
-            try:
-                # Save figure
-                self.viz_generator.save_figure(
-                    self.current_figure,
-                    Path(filepath),
-                    format=export_format,
-                )
-
-                QMessageBox.information(self, "导出成功", f"可视化已导出到:\n{filepath}")
-                self.logger.info(f"Visualization exported: {filepath}")
-
-            except Exception as e:
-                self.logger.error(f"Failed to export visualization: {e}")
-
-                # Check if it's kaleido error
-                if "kaleido" in str(e).lower():
-                    QMessageBox.critical(
-                        self,
-                        "导出失败",
-                        f"PNG 导出需要安装 kaleido 库:\n\npip install kaleido\n\n错误: {str(e)}"
-                    )
-                else:
-                    QMessageBox.critical(self, "导出失败", f"无法导出可视化:\n{str(e)}")
+            # Export in a worker thread; image export blocks on Kaleido
+            self.export_worker = SaveFigureWorker(
+                [(self.current_figure, Path(filepath), export_format)],
+                include_plotlyjs=config.PLOTLY_INCLUDE_PLOTLYJS,
+            )
+            if self.export_thread is None:
+                self.export_thread = QThread(self)
+                self.export_thread.start()
+            self.export_worker.moveToThread(self.export_thread)
+
+            self.export_worker.status.connect(self.on_status_change)
+            self.export_worker.finished.connect(self.on_export_finished)
+            self.export_worker.error.connect(self.on_export_error)
+            self.export_worker.finished.connect(self.export_worker.deleteLater)
+            self.export_worker.error.connect(self.export_worker.deleteLater)
+
+            # Queued to the export thread; the connection drops after one run
+            self._run_export.connect(self.export_worker.run, Qt.SingleShotConnection)
+
+            self.export_btn.setEnabled(False)
+            self._run_export.emit()
+
+    def on_export_finished(self, saved_paths):
+        """Handle export completion."""
+        self.export_btn.setEnabled(True)
+
+        filepath = saved_paths[0] if saved_paths else ""
+        QMessageBox.information(self, "导出成功", f"可视化已导出到:\n{filepath}")
+        self.logger.info(f"Visualization exported: {filepath}")
+
+    def on_export_error(self, error):
+        """Handle export error."""
+        self.export_btn.setEnabled(True)
+        self.logger.error(f"Failed to export visualization: {error}")
+
+        # Check if it's kaleido error
+        if "kaleido" in str(error).lower():
+            QMessageBox.critical(
+                self,
+                "导出失败",
+                f"PNG 导出需要安装 kaleido 库:\n\npip install kaleido\n\n错误: {str(error)}"
+            )
+        else:
+            QMessageBox.critical(self, "导出失败", f"无法导出可视化:\n{str(error)}")
 
     def cleanup(self):
         """Clean up resources."""
@@ -353,5 +428,15 @@ class VisualizationTab(BaseTab):
         if self.web_view:
             self.web_view.setHtml("")
 
+        # Cancel any running export and stop the export thread
+        if self.export_thread is not None:
+            try:
+                if self.export_worker is not None:
+                    self.export_worker.cancel()
+            except RuntimeError:
+                pass  # worker already deleted
+            self.export_thread.quit()
+            self.export_thread.wait()
+
         super().cleanup()
 
@@ -0,0 +1,152 @@
+"""
+BERTopic Pro - Figure Export
+Writes Plotly figures to HTML or static image files.
+
+Kept free of heavy imports (torch, config) so export worker processes
+start quickly.
+"""
+
+from pathlib import Path
+from typing import Union, Any, TYPE_CHECKING
+
+# plotly is imported on first export; this module is loaded at UI startup
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+IMAGE_FORMATS = ("png", "jpeg", "svg", "pdf")
+
+# HTML for figures with at least this many points is streamed trace by trace
+STREAM_HTML_MIN_POINTS = 100_000
+
+_HTML_CONFIG = {'displayModeBar': True, 'responsive': True}
+
+# include_plotlyjs modes the streaming writer handles; others use write_html
+_STREAM_PLOTLYJS_MODES = ('cdn', True, False)
+
+# Same escaping as plotly's to_json_plotly, so JSON inlined in a <script>
+# can't close the tag (e.g. "</script>" in document hover text)
+_JSON_HTML_ESCAPES = ((b'<', b'\\u003c'), (b'>', b'\\u003e'), (b'/', b'\\u002f'))
+
+
+def _count_points(fig: "go.Figure") -> int:
+    """Count x values across all traces."""
+    return sum(len(trace.x) for trace in fig.data if getattr(trace, 'x', None) is not None)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to HTML-safe JSON bytes with orjson, falling back to plotly's encoder."""
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+        else:
+            for char, escaped in _JSON_HTML_ESCAPES:
+                data = data.replace(char, escaped)
+            return data
+
+    from plotly.io.json import to_json_plotly
+    return to_json_plotly(obj).encode('utf-8')
+
+
+def _write_html_streaming(
+    fig: "go.Figure",
+    filepath: Union[str, Path],
+    include_plotlyjs: Union[str, bool],
+) -> None:
+    """
+    Write figure HTML one trace at a time.
+
+    fig.write_html builds the whole page as one Python string; writing each
+    trace's JSON straight to the file keeps peak memory to a single trace.
+    """
+    from plotly.offline import get_plotlyjs, get_plotlyjs_version
+
+    with open(filepath, 'wb') as f:
+        f.write(b'<html>\n<head><meta charset="utf-8" /></head>\n<body>\n')
+        if include_plotlyjs == 'cdn':
+            cdn_url = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+            f.write(f'<script src="{cdn_url}"></script>\n'.encode())
+        elif include_plotlyjs is True:
+            f.write(b'<script type="text/javascript">')
+            f.write(get_plotlyjs().encode('utf-8'))
+            f.write(b'</script>\n')
+
+        f.write(b'<div id="plotly-figure" style="height:100%; width:100%;"></div>\n')
+        f.write(b'<script type="text/javascript">\nPlotly.newPlot("plotly-figure", [')
+        for i, trace in enumerate(fig.data):
+            if i:
+                f.write(b',')
+            f.write(_dumps(trace.to_plotly_json()))
+        f.write(b'], ')
+        f.write(_dumps(fig.layout.to_plotly_json()))
+        f.write(b', ')
+        f.write(_dumps(_HTML_CONFIG))
+        f.write(b');\n</script>\n</body>\n</html>\n')
+
+
+def write_figure(
+    fig: "go.Figure",
+    filepath: Union[str, Path],
+    format: str = "html",
+    include_plotlyjs: Union[str, bool] = "cdn",
+) -> None:
+    """
+    Write a figure to disk.
+
+    Args:
+        fig: Plotly figure
+        filepath: Output file path
+        format: Output format ('html', 'png', 'jpeg', 'svg', 'pdf')
+        include_plotlyjs: How to include plotly.js in HTML (any mode
+            fig.write_html accepts; large figures stream for 'cdn', True, False)
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if format == "html":
+        stream = include_plotlyjs in _STREAM_PLOTLYJS_MODES
+        if stream and _count_points(fig) >= STREAM_HTML_MIN_POINTS:
+            _write_html_streaming(fig, filepath, include_plotlyjs)
+        else:
+            fig.write_html(
+                str(filepath),
+                include_plotlyjs=include_plotlyjs,
+                config=_HTML_CONFIG,
+            )
+    elif format in IMAGE_FORMATS:
+        # Requires kaleido
+        fig.write_image(str(filepath), format=format)
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+
+
+def write_figure_json(
+    fig_json: str,
+    filepath: str,
+    format: str = "html",
+    include_plotlyjs: Union[str, bool] = "cdn",
+) -> str:
+    """
+    Rebuild a figure from JSON and write it (process pool entry point).
+
+    Args:
+        fig_json: Figure serialized with fig.to_json()
+        filepath: Output file path
+        format: Output format
+        include_plotlyjs: How to include plotly.js in HTML
+
+    Returns:
+        The output file path
+    """
+    import plotly.io as pio
+
+    write_figure(pio.from_json(fig_json), filepath, format, include_plotlyjs)
+    return filepath
@@ -4,28 +4,48 @@ Custom Qt-integrated logging handler that displays logs in the UI console.
 """
 
 import logging
-from typing import Optional
-from PySide6.QtCore import QObject, Signal, Slot
+import logging.handlers
+import queue
+from collections import deque
+from typing import Optional, Deque, Tuple
+from PySide6.QtCore import QObject, QTimer, Slot
 from PySide6.QtWidgets import QPlainTextEdit
 from PySide6.QtGui import QTextCursor, QColor, QTextCharFormat
 
 import config
 
 
+# Runs the real handlers for records queued by setup_logging()'s QueueHandler
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
 class QTextEditLogger(QObject, logging.Handler):
     """
-    Custom logging handler that emits Qt signals for thread-safe logging to a QPlainTextEdit widget.
+    Custom logging handler that buffers records for a QPlainTextEdit widget.
 
-    This handler can be used from any thread and will safely update the UI in the main thread.
+    This handler can be used from any thread. Records are queued and a
+    main-thread timer appends everything queued since the last tick in one
+    edit block, so chatty workers cost one repaint per tick, not per line.
     """
 
-    # Signal emitted when a new log message arrives (thread-safe)
-    log_signal = Signal(str, str)  # (formatted_message, level_name)
+    # Console flush interval (ms)
+    FLUSH_INTERVAL_MS = 80
+
+    # Set color based on log level
+    COLOR_MAP = {
+        "DEBUG": QColor("#9e9e9e"),      # Gray
+        "INFO": QColor("#ffffff"),       # White
+        "WARNING": QColor("#ffa726"),    # Orange
+        "ERROR": QColor("#ef5350"),      # Red
+        "CRITICAL": QColor("#d32f2f"),   # Dark Red
+    }
 
     def __init__(self, text_edit: Optional[QPlainTextEdit] = None):
         """
         Initialize the logger.
 
+        Must be created in the main (GUI) thread, which owns the flush timer.
+
         Args:
             text_edit: QPlainTextEdit widget to display logs (can be set later)
         """
@@ -34,9 +54,18 @@ class QTextEditLogger(QObject, logging.Handler):
 
         self.text_edit = text_edit
 
-        # Connect signal to slot if text_edit is provided
-        if self.text_edit:
-            self.log_signal.connect(self.append_log)
+        # (formatted_message, level_name); deque appends/pops are thread-safe
+        self._buffer: Deque[Tuple[str, str]] = deque()
+
+        # While the console is hidden, raw records are kept (unformatted) for
+        # the lines it would still show once made visible again
+        self._console_visible = True
+        self._hidden_records: Deque[logging.LogRecord] = deque(maxlen=config.CONSOLE_LOG_MAX_LINES)
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush_buffer)
+        self._flush_timer.start()
 
         # Set up formatter
         formatter = logging.Formatter(
@@ -53,7 +82,6 @@ class QTextEditLogger(QObject, logging.Handler):
             text_edit: QPlainTextEdit widget to display logs
         """
         self.text_edit = text_edit
-        self.log_signal.connect(self.append_log)
 
     def emit(self, record: logging.LogRecord):
         """
@@ -63,46 +91,51 @@ class QTextEditLogger(QObject, logging.Handler):
             record: The log record to emit
         """
         try:
-            msg = self.format(record)
-            level_name = record.levelname
-            # Emit signal (thread-safe) instead of directly modifying UI
-            self.log_signal.emit(msg, level_name)
+            if not self._console_visible:
+                self._hidden_records.append(record)
+                return
+            # Queue only; the UI is updated from the main thread's timer
+            self._buffer.append((self.format(record), record.levelname))
         except Exception:
             self.handleError(record)
 
-    @Slot(str, str)
-    def append_log(self, message: str, level_name: str):
+    @Slot(bool)
+    def set_console_visible(self, visible: bool):
         """
-        Append log message to the text edit widget (called in main thread only).
+        Track console visibility; records are not formatted while hidden.
 
         Args:
-            message: Formatted log message
-            level_name: Log level name (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            visible: Whether the console widget is shown
         """
-        if not self.text_edit:
+        self._console_visible = visible
+        if visible:
+            while self._hidden_records:
+                record = self._hidden_records.popleft()
+                self._buffer.append((self.format(record), record.levelname))
+
+    @Slot()
+    def flush_buffer(self):
+        """Append all queued log messages to the text edit (main thread only)."""
+        if not self.text_edit or not self._console_visible or not self._buffer:
             return
 
-        # Set color based on log level
-        color_map = {
-            "DEBUG": QColor("#9e9e9e"),      # Gray
-            "INFO": QColor("#ffffff"),       # White
-            "WARNING": QColor("#ffa726"),    # Orange
-            "ERROR": QColor("#ef5350"),      # Red
-            "CRITICAL": QColor("#d32f2f"),   # Dark Red
-        }
+        # Drain what is queued now; records arriving meanwhile wait a tick
+        records = [self._buffer.popleft() for _ in range(len(self._buffer))]
 
-        color = color_map.get(level_name, QColor("#ffffff"))
-
-        # Create text format with color
-        text_format = QTextCharFormat()
-        text_format.setForeground(color)
-
-        # Move cursor to end
         cursor = self.text_edit.textCursor()
         cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
 
-        # Insert colored text
-        cursor.insertText(message + "\n", text_format)
+        # Insert consecutive records of the same level as one colored run
+        start = 0
+        for i in range(1, len(records) + 1):
+            if i == len(records) or records[i][1] != records[start][1]:
+                text_format = QTextCharFormat()
+                text_format.setForeground(self.COLOR_MAP.get(records[start][1], QColor("#ffffff")))
+                cursor.insertText("\n".join(msg for msg, _ in records[start:i]) + "\n", text_format)
+                start = i
+
+        cursor.endEditBlock()
 
         # Auto-scroll to bottom
         self.text_edit.moveCursor(QTextCursor.End)
@@ -123,17 +156,26 @@ def setup_logging(text_edit: Optional[QPlainTextEdit] = None) -> QTextEditLogger
     """
     Set up application-wide logging with file and optional Qt UI handlers.
 
+    Logging calls format the message and enqueue the record (QueueHandler's
+    default prepare()); a QueueListener thread runs the file, console and Qt
+    handlers, so file and console I/O stay off the GUI and worker threads.
+
     Args:
         text_edit: Optional QPlainTextEdit widget for UI logging
 
     Returns:
         QTextEditLogger instance for UI integration
     """
+    global _queue_listener
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, config.LOG_LEVEL))
 
     # Clear any existing handlers
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
     root_logger.handlers.clear()
 
     # File handler (always enabled)
@@ -149,7 +191,6 @@ def setup_logging(text_edit: Optional[QPlainTextEdit] = None) -> QTextEditLogger
         datefmt=config.LOG_DATE_FORMAT
     )
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
 
     # Console handler (for terminal output)
     console_handler = logging.StreamHandler()
@@ -158,12 +199,21 @@ def setup_logging(text_edit: Optional[QPlainTextEdit] = None) -> QTextEditLogger
         "%(levelname)s - %(message)s"
     )
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
 
     # Qt UI handler (if text_edit provided)
     qt_handler = QTextEditLogger(text_edit)
     qt_handler.setLevel(logging.INFO)  # Only INFO and above for UI
-    root_logger.addHandler(qt_handler)
+
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        qt_handler,
+        respect_handler_level=True,
+    )
+    _queue_listener.start()
 
     # Log startup message
     logging.info(f"{config.APP_NAME} v{config.APP_VERSION} - Logging initialized")
@@ -173,6 +223,28 @@ def setup_logging(text_edit: Optional[QPlainTextEdit] = None) -> QTextEditLogger
     return qt_handler
 
 
+def shutdown_logging() -> None:
+    """
+    Drain the log queue and stop the listener thread.
+
+    The file and console handlers are reattached to the root logger
+    directly, so messages logged during shutdown are still written.
+    """
+    global _queue_listener
+
+    if _queue_listener is None:
+        return
+
+    listener, _queue_listener = _queue_listener, None
+    listener.stop()
+
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    for handler in listener.handlers:
+        if not isinstance(handler, QTextEditLogger):
+            root_logger.addHandler(handler)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -184,7 +256,3 @@ def get_logger(name: str) -> logging.Logger:
         Logger instance
     """
     return logging.getLogger(name)
-
-
-# Import for convenience
-import logging.handlers
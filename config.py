@@ -4,6 +4,7 @@ Defines all application-wide constants, paths, and default parameters.
 """
 
 import os
+import importlib.util
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -90,6 +91,12 @@ DEFAULT_UMAP_N_COMPONENTS = 5
 DEFAULT_UMAP_MIN_DIST = 0.0
 DEFAULT_UMAP_METRIC = "cosine"
 
+# Corpora at least this large get a cached pynndescent k-NN graph passed to UMAP
+UMAP_PRECOMPUTED_KNN_MIN_DOCS = 4096
+
+# Above this size UMAP uses random init; spectral init gets slow on huge graphs
+UMAP_SPECTRAL_INIT_MAX_DOCS = 200000
+
 # HDBSCAN parameters
 DEFAULT_HDBSCAN_MIN_CLUSTER_SIZE = 10
 DEFAULT_HDBSCAN_MIN_SAMPLES = 10
@@ -97,6 +104,14 @@ DEFAULT_HDBSCAN_METRIC = "euclidean"
 DEFAULT_HDBSCAN_CLUSTER_SELECTION_METHOD = "eom"
 DEFAULT_HDBSCAN_CLUSTER_SELECTION_EPSILON = 0.0
 
+# Corpora larger than this cluster on a sparse approximate k-NN graph
+HDBSCAN_APPROX_KNN_MIN_DOCS = 50000
+DEFAULT_HDBSCAN_KNN = 30
+
+# MiniBatchKMeans clustering backend (TopicModelParams.cluster_backend='kmeans')
+DEFAULT_KMEANS_N_CLUSTERS = 50
+KMEANS_BATCH_SIZE = 1024
+
 # c-TF-IDF parameters
 DEFAULT_TOP_N_WORDS = 10
 DEFAULT_MIN_TOPIC_SIZE = 10
@@ -108,10 +123,14 @@ DEFAULT_MIN_TOPIC_SIZE = 10
 # Stopwords file path
 DEFAULT_STOPWORDS_PATH = DATA_DIR / "stopwords_zh.txt"
 
-# Chinese text processing
+# Chinese text processing (parallel mode runs the pipeline in worker processes)
 JIEBA_PARALLEL_MODE = True
 JIEBA_PARALLEL_PROCESSES = 4
 
+# c-TF-IDF tokenization runs in worker processes above this many characters
+VECTORIZER_PARALLEL_MIN_CHARS = 5_000_000
+VECTORIZER_N_JOBS = os.cpu_count() or 1
+
 # Text cleaning options
 DEFAULT_REMOVE_URLS = True
 DEFAULT_REMOVE_EMAILS = True
@@ -127,14 +146,44 @@ DEFAULT_MIN_TEXT_LENGTH = 10
 DATA_PREVIEW_ROWS = 50
 DATA_PREVIEW_MAX_COLUMN_WIDTH = 200
 
+# Embedding cache storage dtype ('float32', 'float16' or 'int8')
+DEFAULT_EMBEDDING_CACHE_DTYPE = "float32"
+
+# Embedding cache tier: 'disk' or 'shm' (RAM-backed /dev/shm on Linux, bounded below)
+EMBEDDING_CACHE_TIER = "disk"
+SHM_CACHE_DIR = Path("/dev/shm") / "bertopic_pro_embeddings"
+SHM_CACHE_MAX_BYTES = 2 * 1024 ** 3
+SHM_CACHE_TTL_SECONDS = 24 * 3600
+
+# Documents joined per hasher.update() call when computing cache keys
+CACHE_HASH_BATCH_DOCS = 16384
+
 # Batch processing
 EMBEDDING_BATCH_SIZE = 1000
+EMBEDDING_ENCODE_BATCH_SIZE = 64  # Sentences per forward pass in encode()
+# GPU batch auto-sizing: free memory / per-sample budget, clamped
+EMBEDDING_BYTES_PER_SAMPLE = 16 * 1024 ** 2
+EMBEDDING_MIN_BATCH_SIZE = 32
+EMBEDDING_MAX_BATCH_SIZE = 512
+# torch.compile the embedding backbone; needs a working Triton (GPU) or C++
+# toolchain (CPU), and the first batches pay the compilation cost
+EMBEDDING_TORCH_COMPILE = False
+EMBEDDING_COMPILE_MODE = "reduce-overhead"
 PROCESSING_BATCH_SIZE = 100
+PROCESSING_CHUNK_SIZE = 10000  # Rows per block in TextProcessor.process_dataframe
+PARALLEL_CHUNK_SIZE = 1000  # Rows per task when processing in worker processes
+# Smaller inputs run serially: each worker process pays seconds of imports and
+# a Jieba dictionary load before its first chunk
+PARALLEL_MIN_ROWS = 50_000
 
 # ============================================================================
 # Hardware Settings
 # ============================================================================
 
+# Thread pools for numba (UMAP) and OpenMP; set before any of them initialize
+os.environ.setdefault("NUMBA_NUM_THREADS", str(os.cpu_count() or 1))
+os.environ.setdefault("OMP_NUM_THREADS", str(os.cpu_count() or 1))
+
 # Device selection (auto-detect by default)
 import torch
 
@@ -216,6 +265,15 @@ PLOTLY_CONFIG = {
 PLOTLY_FONT_FAMILY = "Noto Sans CJK SC, Arial, sans-serif"
 PLOTLY_FONT_SIZE = 12
 
+# Scatter plots with at least this many points render as WebGL (Scattergl)
+SCATTERGL_MIN_POINTS = 1000
+# Document projections above this size are rasterized with datashader
+RASTERIZE_THRESHOLD = 100_000
+# Larger point projections are down-sampled per topic before plotting
+DOCUMENT_PLOT_MAX_POINTS = 50_000
+# Seed for that sample, so a model always shows the same documents
+RANDOM_SEED = 42
+
 # ============================================================================
 # Model Download Settings
 # ============================================================================
@@ -227,6 +285,17 @@ HF_CACHE_DIR = Path.home() / ".cache" / "huggingface" / "hub"
 DOWNLOAD_TIMEOUT = 600  # 10 minutes
 DOWNLOAD_RETRY_ATTEMPTS = 3
 
+# Number of loaded embedding models kept in memory
+MODEL_CACHE_SIZE = 2
+
+# Parallel file downloads per model
+DOWNLOAD_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# hf_transfer (Rust multi-stream downloader) when installed; huggingface_hub
+# reads this once at import, so it must be set before the first import
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 # ============================================================================
 # Performance Settings
 # ============================================================================
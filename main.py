@@ -7,6 +7,7 @@ import sys
 import logging
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QFont, QFontDatabase
+from PySide6.QtCore import Qt, QCoreApplication
 
 import config
 from app.ui.main_window import MainWindow
@@ -73,6 +74,10 @@ def main():
     logging.info(f"Starting {config.APP_NAME} v{config.APP_VERSION}")
     logging.info("=" * 60)
 
+    # The visualization tab imports QtWebEngine after startup, which needs
+    # shared OpenGL contexts requested before the application exists
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+
     # Create application
     app = QApplication(sys.argv)
 
@@ -0,0 +1,81 @@
+"""
+Tests for TextProcessor.process_dataframe: chunked runs match the serial path.
+"""
+
+import pandas as pd
+import pytest
+
+import config
+from app.core.processor import TextProcessor
+
+
+TEXTS = [
+    "今天天气很好，我们去公园散步吧！",
+    "访问 https://example.com 了解更多的信息",
+    "联系 foo@example.com 获取报价 123 元",
+    None,
+    "",
+    "机器学习和自然语言处理是人工智能的重要分支",
+    "重复的标题",
+    "重复的标题",
+] * 8
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'text': TEXTS, 'id': range(len(TEXTS))})
+
+
+def expected_column(processor: TextProcessor, **options) -> list:
+    return [processor.process_text(text, **options) for text in TEXTS]
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {'segment': False},
+    {'remove_stopwords': False, 'min_word_length': 2},
+    {'clean_options': {'remove_urls': False, 'remove_numbers': True, 'lowercase': True}},
+])
+def test_chunked_serial_matches_process_text(monkeypatch, df, options):
+    monkeypatch.setattr(config, 'PROCESSING_CHUNK_SIZE', 5)
+    processor = TextProcessor()
+
+    result = processor.process_dataframe(df, 'text', **options)
+
+    assert result['text_processed'].tolist() == expected_column(processor, **options)
+    assert result['id'].tolist() == df['id'].tolist()
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {'clean_options': {'remove_punctuation': False, 'lowercase': True}},
+])
+def test_parallel_matches_serial(monkeypatch, df, options):
+    monkeypatch.setattr(config, 'PARALLEL_MIN_ROWS', 1)
+    monkeypatch.setattr(config, 'PARALLEL_CHUNK_SIZE', 7)
+    monkeypatch.setattr(config, 'JIEBA_PARALLEL_MODE', True)
+    monkeypatch.setattr(config, 'JIEBA_PARALLEL_PROCESSES', 2)
+    serial = TextProcessor()
+    parallel = TextProcessor(enable_parallel=True)
+    assert parallel.n_jobs == 2
+
+    result = parallel.process_dataframe(df, 'text', **options)
+
+    assert result['text_processed'].tolist() == expected_column(serial, **options)
+
+
+def test_progress_reaches_completion(monkeypatch, df):
+    monkeypatch.setattr(config, 'PROCESSING_CHUNK_SIZE', 16)
+    reported = []
+
+    TextProcessor().process_dataframe(
+        df, 'text', progress_callback=lambda pct, msg: reported.append(pct)
+    )
+
+    assert reported == sorted(reported)
+    assert reported[-1] == 100
+
+
+def test_missing_column_raises(df):
+    with pytest.raises(ValueError):
+        TextProcessor().process_dataframe(df, 'missing')
@@ -0,0 +1,101 @@
+"""
+Tests for app.core.text_pipeline: every regex engine cleans text alike.
+"""
+
+import itertools
+import re
+
+import pandas as pd
+import pytest
+
+from app.core import text_pipeline
+
+
+SAMPLES = [
+    "今天天气很好，我们去公园散步吧！",
+    "访问 https://example.com/path?q=1&x=(2) 了解更多",
+    "联系 foo.bar@example.co 或 http://a.b/c",
+    "价格：１２３元，数量 456 件，编号 A_1-b",
+    "阿拉伯数字 ٣٤ 与全角空格　和不换行空格\xa0混排",
+    "  多个   空白\t\n换行\r\n  ",
+    "Mixed CASE 文本 with émojis 🎉 and café",
+    "",
+]
+
+# All 32 combinations of the cleaning flags clean_text() accepts
+OPTION_NAMES = (
+    'remove_urls', 'remove_emails', 'remove_punctuation', 'remove_numbers', 'lowercase'
+)
+OPTIONS = [dict(zip(OPTION_NAMES, flags)) for flags in itertools.product((True, False), repeat=5)]
+
+
+def reference_clean(text: str, options: dict) -> str:
+    """clean_text() spelled out with the stdlib patterns only."""
+    source = text_pipeline.combined_source(
+        options['remove_urls'],
+        options['remove_emails'],
+        options['remove_numbers'],
+        options['remove_punctuation'],
+    )
+    if source is not None:
+        text = re.sub(source, ' ', text)
+    if options['lowercase']:
+        text = text.lower()
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+@pytest.fixture(params=['re', 're2'])
+def engine(request, monkeypatch):
+    """Run clean_text() on the stdlib engine or on google-re2."""
+    if request.param == 're2':
+        re2 = pytest.importorskip("re2")
+    else:
+        re2 = None
+    monkeypatch.setattr(text_pipeline, 're2', re2)
+    text_pipeline.combined_pattern.cache_clear()
+    yield request.param
+    text_pipeline.combined_pattern.cache_clear()
+
+
+def test_whitespace_class_matches_python():
+    chars = ''.join(map(chr, range(0x3100)))
+    assert re.findall(r'\s', chars) == re.findall(f"[{text_pipeline._SPACE}]", chars)
+
+
+@pytest.mark.parametrize("options", OPTIONS)
+def test_clean_text_matches_reference(engine, options):
+    for text in SAMPLES:
+        assert text_pipeline.clean_text(text, **options) == reference_clean(text, options)
+
+
+@pytest.mark.parametrize("use_arrow", [False, True])
+@pytest.mark.parametrize("options", OPTIONS)
+def test_clean_series_matches_clean_text(engine, monkeypatch, use_arrow, options):
+    if use_arrow:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(text_pipeline, 'PYARROW_AVAILABLE', use_arrow)
+
+    cleaned = text_pipeline.clean_series(pd.Series(SAMPLES), **options)
+
+    assert cleaned.tolist() == [reference_clean(text, options) for text in SAMPLES]
+
+
+def test_clean_series_blanks_non_text(engine):
+    cleaned = text_pipeline.clean_series(pd.Series(["文本 1", None, 3.5, float('nan')]))
+
+    assert cleaned.tolist() == ["文本 1", "", "", ""]
+
+
+def test_process_series_matches_per_text_pipeline():
+    stopwords = frozenset({"我们", "的"})
+    clean_options = {'remove_urls': True, 'remove_emails': True, 'remove_punctuation': True}
+
+    processed = text_pipeline.process_series(
+        pd.Series(SAMPLES), stopwords, clean_options, min_word_length=2
+    )
+
+    expected = [
+        text_pipeline.join_words(text_pipeline.clean_text(text, **clean_options), stopwords, 2)
+        for text in SAMPLES
+    ]
+    assert processed.tolist() == expected
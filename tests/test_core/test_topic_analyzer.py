@@ -0,0 +1,166 @@
+"""
+Tests for TopicAnalyzer's embedding cache and ParallelCountVectorizer.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip("bertopic")
+
+import config
+from sklearn.feature_extraction.text import CountVectorizer
+from app.core.model_manager import ModelManager
+from app.core.topic_analyzer import ParallelCountVectorizer, TopicAnalyzer
+
+
+MODEL = "test-model"
+
+DOCS = [
+    "机器 学习 模型 训练",
+    "自然 语言 处理 分词",
+    "机器 学习 自然 语言",
+    "主题 模型 聚类 分析 主题",
+    "深度 学习 模型",
+] * 20
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    analyzer = TopicAnalyzer(model_manager=ModelManager(cache_dir=tmp_path), cache_dir=tmp_path)
+    analyzer.embedding_cache_dir = tmp_path
+    return analyzer
+
+
+@pytest.fixture
+def embeddings():
+    return np.random.default_rng(0).standard_normal((len(DOCS), 8)).astype(np.float32)
+
+
+def cache_key(analyzer, documents, model=MODEL, normalize=False):
+    return analyzer._get_embedding_cache_path(documents, model, normalize).name
+
+
+class TestEmbeddingCacheKey:
+    def test_stable(self, analyzer):
+        assert cache_key(analyzer, DOCS) == cache_key(analyzer, list(DOCS))
+
+    def test_document_boundaries_are_part_of_the_key(self, analyzer):
+        assert cache_key(analyzer, ["ab"]) != cache_key(analyzer, ["a", "b"])
+        assert cache_key(analyzer, ["a", "bc"]) != cache_key(analyzer, ["ab", "c"])
+
+    def test_model_is_part_of_the_key(self, analyzer):
+        assert cache_key(analyzer, DOCS, model="a") != cache_key(analyzer, DOCS, model="b")
+
+    def test_normalization_is_part_of_the_key(self, analyzer):
+        assert cache_key(analyzer, DOCS) != cache_key(analyzer, DOCS, normalize=True)
+
+    def test_independent_of_hash_batch_size(self, analyzer, monkeypatch):
+        monkeypatch.setattr(config, 'CACHE_HASH_BATCH_DOCS', 3)
+        small_batches = cache_key(analyzer, DOCS)
+        monkeypatch.setattr(config, 'CACHE_HASH_BATCH_DOCS', 1000)
+
+        assert cache_key(analyzer, DOCS) == small_batches
+
+
+class TestEmbeddingCacheFiles:
+    @pytest.fixture
+    def cache_path(self, analyzer):
+        return analyzer._get_embedding_cache_path(DOCS, MODEL)
+
+    def test_round_trip(self, analyzer, cache_path, embeddings):
+        analyzer._save_embeddings_cache(cache_path, embeddings, MODEL)
+
+        loaded = analyzer._load_cached_embeddings(cache_path, MODEL)
+
+        assert isinstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, embeddings)
+        meta = json.loads(cache_path.with_suffix('.json').read_text(encoding='utf-8'))
+        assert meta['shape'] == list(embeddings.shape)
+        assert meta['dtype'] == 'float32'
+        assert meta['model_name'] == MODEL
+
+    def test_float16_upcast(self, analyzer, cache_path, embeddings):
+        analyzer._save_embeddings_cache(cache_path, embeddings, MODEL, "float16")
+
+        upcast = analyzer._load_cached_embeddings(cache_path, MODEL, "float16")
+        mapped = analyzer._load_cached_embeddings(cache_path, MODEL, "float16", upcast=False)
+
+        assert upcast.dtype == np.float32
+        assert mapped.dtype == np.float16 and isinstance(mapped, np.memmap)
+        np.testing.assert_array_equal(upcast, embeddings.astype(np.float16))
+
+    def test_int8_dequantized(self, analyzer, cache_path, embeddings):
+        analyzer._save_embeddings_cache(cache_path, embeddings, MODEL, "int8")
+
+        loaded = analyzer._load_cached_embeddings(cache_path, MODEL, "int8")
+
+        assert loaded.dtype == np.float32
+        scale = np.abs(embeddings).max(axis=1, keepdims=True) / 127.0
+        assert np.all(np.abs(loaded - embeddings) <= scale)
+
+    def test_miss_without_files(self, analyzer, cache_path):
+        assert analyzer._load_cached_embeddings(cache_path, MODEL) is None
+
+    def test_miss_without_header(self, analyzer, cache_path, embeddings):
+        analyzer._save_embeddings_cache(cache_path, embeddings, MODEL)
+        cache_path.with_suffix('.json').unlink()
+
+        assert analyzer._load_cached_embeddings(cache_path, MODEL) is None
+
+    @pytest.mark.parametrize("model, dtype", [("other-model", "float32"), (MODEL, "float16")])
+    def test_miss_on_request_mismatch(self, analyzer, cache_path, embeddings, model, dtype):
+        analyzer._save_embeddings_cache(cache_path, embeddings, MODEL)
+
+        assert analyzer._load_cached_embeddings(cache_path, model, dtype) is None
+
+    def test_miss_on_header_mismatch(self, analyzer, cache_path, embeddings):
+        analyzer._save_embeddings_cache(cache_path, embeddings, MODEL)
+        meta_path = cache_path.with_suffix('.json')
+        meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        meta['shape'] = [len(DOCS) - 1, 8]
+        meta_path.write_text(json.dumps(meta), encoding='utf-8')
+
+        assert analyzer._load_cached_embeddings(cache_path, MODEL) is None
+
+    def test_miss_on_corrupt_header(self, analyzer, cache_path, embeddings):
+        analyzer._save_embeddings_cache(cache_path, embeddings, MODEL)
+        cache_path.with_suffix('.json').write_text("{not json", encoding='utf-8')
+
+        assert analyzer._load_cached_embeddings(cache_path, MODEL) is None
+
+
+class TestParallelCountVectorizer:
+    @pytest.fixture(autouse=True)
+    def force_parallel(self, monkeypatch):
+        monkeypatch.setattr(config, 'VECTORIZER_PARALLEL_MIN_CHARS', 0)
+        monkeypatch.setattr(config, 'VECTORIZER_N_JOBS', 2)
+
+    @pytest.mark.parametrize("options", [
+        {},
+        {'ngram_range': (1, 2)},
+        {'min_df': 2, 'max_features': 6},
+        {'binary': True, 'max_df': 0.5},
+    ])
+    def test_matches_count_vectorizer(self, options):
+        parallel = ParallelCountVectorizer(**options)
+        serial = CountVectorizer(**options)
+
+        X_parallel = parallel.fit_transform(DOCS)
+        X_serial = serial.fit_transform(DOCS)
+
+        assert parallel.vocabulary_ == serial.vocabulary_
+        assert list(parallel.get_feature_names_out()) == list(serial.get_feature_names_out())
+        assert (X_parallel != X_serial).nnz == 0
+
+        new_docs = ["机器 学习 新 文档", "主题 分析"] * 3
+        assert (parallel.transform(new_docs) != serial.transform(new_docs)).nnz == 0
+
+    def test_fixed_vocabulary(self):
+        vocabulary = {"学习": 0, "模型": 1, "主题": 2}
+
+        X_parallel = ParallelCountVectorizer(vocabulary=vocabulary).fit_transform(DOCS)
+        X_serial = CountVectorizer(vocabulary=vocabulary).fit_transform(DOCS)
+
+        assert (X_parallel != X_serial).nnz == 0